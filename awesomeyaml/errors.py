@@ -140,16 +140,16 @@ class UnsafeError(EvalError):
     base_msg = 'Avoiding execution of an !unsafe {} node under path: {}'
 
 
-@contextlib.contextmanager
-def rethrow_point(error_type, self, path, other):
-    try:
-        yield
-    except error_type as e:
+def rethrow_as(error_type, e, self, path, other):
+    ''' Should be called while handling an exception ``e`` - either reraises ``e``
+        or raises an ``error_type`` error caused by it, depending on the global settings.
+    '''
+    if isinstance(e, error_type):
         if shorten_traceback:
             raise
         else:
             raise error_type(error_msg=None, node=self, path=path, extra_node=other) from e
-    except Exception as e:
+    else:
         if rethrow:
             reason = None
             if include_original_exception:
@@ -158,3 +158,11 @@ def rethrow_point(error_type, self, path, other):
             raise error_type(error_msg=str(e), node=self, path=path, extra_node=other) from reason
         else:
             raise
+
+
+@contextlib.contextmanager
+def rethrow_point(error_type, self, path, other):
+    try:
+        yield
+    except Exception as e:
+        rethrow_as(error_type, e, self, path, other)
@@ -19,6 +19,7 @@ from .utils import Bunch
 from . import errors
 from . import utils
 
+import os
 import copy
 import contextlib
 
@@ -41,7 +42,7 @@ class EvalContext(metaclass=NamespaceableMeta):
         def __getitem__(self, key):
             if key not in self:
                 node = self._cfgobj[key]
-                return self._eval_ctx.evaluate_node(node, self._path + [key])
+                return self._eval_ctx.evaluate_node(node, self._path.child(key))
 
             return super().__getitem__(key)
 
@@ -51,8 +52,8 @@ class EvalContext(metaclass=NamespaceableMeta):
             return self[name]
 
         def __setattr__(self, name, value):
-            if name.startswith('_'):
-                return super().__setattr__(name, value)
+            if name[:1] == '_':
+                return object.__setattr__(self, name, value)
 
             if name in self.__dict__:
                 raise ValueError('Name conflict!')
@@ -66,7 +67,7 @@ class EvalContext(metaclass=NamespaceableMeta):
                 del self[name]
 
         def get_or_set(self, key):
-            return self.setdefault(key, EvalContext.PartialChild(self._path + [key], self._eval_ctx, self._cfgobj[key]))
+            return self.setdefault(key, EvalContext.PartialChild(self._path.child(key), self._eval_ctx, self._cfgobj[key]))
 
     _default_eval_symbols = {}
 
@@ -81,12 +82,14 @@ class EvalContext(metaclass=NamespaceableMeta):
         self._removed_nodes = {}
         self._eval_cache = {}
         self._eval_cache_id = {}
+        self._xref_cache = {}
         self._eval_symbols = copy.copy(EvalContext._default_eval_symbols)
         if eval_symbols:
             self._eval_symbols.update(eval_symbols)
 
         self._require_all_safe = False
         self._eval_stack = []
+        self._cwd = None
 
         self.user_data = None
 
@@ -115,6 +118,13 @@ class EvalContext(metaclass=NamespaceableMeta):
         finally:
             self._require_all_safe = old
 
+    def get_cwd(self):
+        ''' Returns the current working directory, queried once per call to :py:meth:`evaluate`.
+        '''
+        if self._cwd is None:
+            self._cwd = os.getcwd()
+        return self._cwd
+
     def get_node(self, *path, **kwargs):
         path = NodePath.get_list_path(*path)
         if str(path) in self._eval_cache:
@@ -130,7 +140,7 @@ class EvalContext(metaclass=NamespaceableMeta):
         prefix = NodePath.get_list_path(prefix, check_types=False) or NodePath()
 
         if self._require_all_safe:
-            if not cfgobj.ayns.safe:
+            if not cfgobj._get_safe():
                 raise errors.UnsafeError(f'Note: the current context requires all evaluated nodes to be safe - see chained exceptions for more information', cfgobj, str(prefix))
 
         if id(cfgobj) in self._eval_cache_id:
@@ -167,6 +177,8 @@ class EvalContext(metaclass=NamespaceableMeta):
         self._ecfg = EvalContext.PartialChild(NodePath(), self, self._cfg)
         self._eval_cache.clear()
         self._eval_cache_id.clear()
+        self._xref_cache.clear()
+        self._cwd = None
         self.user_data = Bunch()
 
         try:
@@ -174,6 +186,8 @@ class EvalContext(metaclass=NamespaceableMeta):
         finally:
             self._eval_cache.clear()
             self._eval_cache_id.clear()
+            self._xref_cache.clear()
+            self._cwd = None
             self._cfg = None
             self._ecfg = None
 
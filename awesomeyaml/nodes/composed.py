@@ -164,7 +164,7 @@ class ComposedNode(ConfigNode):
             to_del = []
             to_re_set = []
             for name, child in self.ayns.named_children():
-                child_path = prefix + [name]
+                child_path = prefix.child(name)
                 keep = False
                 if condition(child_path, child):
                     keep = True
@@ -180,7 +180,7 @@ class ComposedNode(ConfigNode):
             for name in reversed(to_del):
                 self.ayns.remove_child(name)
                 if removed is not None:
-                    removed.add(prefix + [name])
+                    removed.add(prefix.child(name))
             for name, child in to_re_set:
                 self.ayns.set_child(name, child)
 
@@ -196,7 +196,7 @@ class ComposedNode(ConfigNode):
                 if cache_results and id(child) in cache:
                     possibly_new_child = cache[id(child)]
                 else:
-                    child_path = prefix + [name]
+                    child_path = prefix.child(name)
                     possibly_new_child = child
                     if isinstance(child, ComposedNode) and recurse:
                         possibly_new_child = possibly_new_child.ayns.map_nodes(map_fn, prefix=child_path, cache_results=cache_results, cache=cache, leafs_only=leafs_only)
@@ -229,7 +229,7 @@ class ComposedNode(ConfigNode):
             for name, child in self._children.items():
                 if child is None or (id(child) in memo and not allow_duplicates):
                     continue
-                child_path = prefix + [name]
+                child_path = prefix.child(name)
                 if not recursive or not isinstance(child, ComposedNode):
                     memo.add(id(child))
                     yield child_path, child
@@ -285,7 +285,7 @@ class ComposedNode(ConfigNode):
             if not isinstance(other, ComposedNode):
                 return ConfigNode.ayns.on_merge_impl(self, path, other)
 
-            if other.ayns.delete:
+            if other._get_delete():
                 removed = set()
                 def maybe_keep(path, node):
                     other_node = other.ayns.get_first_not_missing_node(path)
@@ -305,11 +305,11 @@ class ComposedNode(ConfigNode):
             for key, value in other._children.items():
                 child = self.ayns.get_child(key, None)
                 if child is None:
-                    value.ayns._require_all_new(path + [key], f'last parent: {_this_path!r}, from file: {self.ayns.source_file!r}')
+                    value.ayns._require_all_new(path.child(key), f'last parent: {_this_path!r}, from file: {self.ayns.source_file!r}')
                     self.ayns.set_child(key, value)
                 else:
                     merge = isinstance(child, ComposedNode)
-                    possibly_new_child = child.ayns.on_merge(path + [key], value)
+                    possibly_new_child = child.ayns.on_merge(path.child(key), value)
 
                     if merge:
                         if not possibly_new_child and not possibly_new_child.ayns.has_priority_over(value) and value.ayns.explicit_delete:
@@ -318,7 +318,7 @@ class ComposedNode(ConfigNode):
                             self.ayns.set_child(key, possibly_new_child)
                     else:
                         if possibly_new_child is not child:
-                            possibly_new_child.ayns._require_all_new(path + [key], f'last parent: {_this_path!r}, from file: {self.ayns.source_file!r}', include_self=False)
+                            possibly_new_child.ayns._require_all_new(path.child(key), f'last parent: {_this_path!r}, from file: {self.ayns.source_file!r}', include_self=False)
                             if not possibly_new_child and possibly_new_child.ayns.explicit_delete:
                                 self.ayns.remove_child(key)
                             else:
@@ -339,7 +339,7 @@ class ComposedNode(ConfigNode):
         def _require_all_new(self, path, reason, exceptions=None, include_self=True):
             seq = self.ayns.nodes_with_paths(prefix=path, include_self=include_self)
             for p, n in seq:
-                if not n.ayns.allow_new and (exceptions is None or p not in exceptions):
+                if not n._get_allow_new() and (exceptions is None or p not in exceptions):
                     raise ValueError(f'Node {p!r} (source file: {n.ayns.source_file!r}) requires that the destination already exists but the current config tree does not contain a node under this path ({reason})')
 
 
@@ -69,7 +69,7 @@ class FunctionNode(ConfigDict):
                 self._replace_other(other)
                 return self
 
-            if other.ayns.delete:
+            if other._get_delete():
                 self.clear()
             self._func = other._func
 
@@ -81,7 +81,8 @@ class FunctionNode(ConfigDict):
 
     @namespace('ayns')
     def represent(self):
-        return self.ayns.tag, self.ayns.get_node_info_to_save(), super()._get_value()
+        ayns = self.ayns
+        return ayns.tag, ayns.get_node_info_to_save(), super()._get_value()
 
     @namespace('ayns')
     @property
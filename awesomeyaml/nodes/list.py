@@ -144,7 +144,7 @@ class ConfigList(ComposedNode, list):
                 raise MergeError(f'merging a dict into a list requires all dict nodes to map to the existing indices in the list but the following keys are invalid: {_missing_keys}', node=self, path=prefix, extra_node=first_missing)
 
         def keep_if_exists(path, node):
-            if not node.ayns.delete:
+            if not node._get_delete():
                 return True
             current = self.ayns.get_first_not_missing_node(path)
             return node.ayns.has_priority_over(current, if_equal=True)
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 import threading
 import contextlib
 import collections.abc as cabc
@@ -23,25 +22,50 @@ from ..utils import persistent_id, notnone_or
 from ..import errors
 
 
-_kwargs_to_inherit = [
-    'priority',
-    'implicit_delete',
-    'implicit_allow_new',
-    'implicit_safe',
-    'pyyaml_node'
-]
+_weak_priority = -1
+_standard_priority = 0
+_force_priority = 1
+_valid_priorities = frozenset([None, _standard_priority, _weak_priority, _force_priority])
+
+# maps types of values passed to ConfigNode(...) to the node types deduced for them,
+# the result of the (relatively slow) isinstance checks against the abstract collection
+# types only depends on the type of a value so it is enough to run them once per type
+_deduced_types = {}
+
+# node types which can be deduced by ConfigNode(...), imported on first use to avoid circular imports
+_ConfigDict = None
+_ConfigList = None
+_ConfigTuple = None
+_ConfigScalar = None
+
+
+def _import_deduced_types():
+    global _ConfigDict, _ConfigList, _ConfigTuple, _ConfigScalar
+    from .dict import ConfigDict as _ConfigDict
+    from .list import ConfigList as _ConfigList
+    from .tuple import ConfigTuple as _ConfigTuple
+    from .scalar import ConfigScalar as _ConfigScalar
+
+    for value_type, node_type in [(dict, _ConfigDict), (list, _ConfigList), (tuple, _ConfigTuple)]:
+        _deduced_types.setdefault(value_type, node_type)
+    for value_type in [str, bytes, int, float, bool, type(None)]:
+        _deduced_types.setdefault(value_type, _ConfigScalar)
 
 
 def decorator_factory(error_type):
     def decorator(func):
         def impl(*args, **kwargs):
-            self = args[0]
-            path = args[1] if len(args) > 1 else kwargs['path']
-            other = args[2] if len(args) > 2 else kwargs.get('other', None)
-            if not isinstance(other, ConfigNode):
-                other = None
-            with errors.rethrow_point(error_type, self, path, other):
+            # equivalent to running func inside errors.rethrow_point but without
+            # the overhead of a context manager when no exception is raised
+            try:
                 return func(*args, **kwargs)
+            except Exception as e:
+                self = args[0]
+                path = args[1] if len(args) > 1 else kwargs['path']
+                other = args[2] if len(args) > 2 else kwargs.get('other', None)
+                if getattr(other, '_is_config_node', False) is not True:
+                    other = None
+                errors.rethrow_as(error_type, e, self, path, other)
 
         return impl
     return decorator
@@ -53,7 +77,87 @@ rethrow_as_merge_error = decorator_factory(errors.MergeError)
 rethrow_as_eval_error = decorator_factory(errors.EvalError)
 
 
+def _inherit_kwargs(node, kwargs):
+    ''' Sets the inheritable arguments from ``kwargs`` on an already existing ``node``,
+        used when a node is passed to ``ConfigNode(...)``.
+    '''
+    propagate = False
+    if 'priority' in kwargs:
+        node._priority = kwargs['priority']
+    if 'implicit_delete' in kwargs:
+        node._implicit_delete = kwargs['implicit_delete']
+        propagate = True
+    if 'implicit_allow_new' in kwargs:
+        node._implicit_allow_new = kwargs['implicit_allow_new']
+        propagate = True
+    # do not change implicit_safe if already set to False
+    if 'implicit_safe' in kwargs and node._implicit_safe is not False:
+        node._implicit_safe = kwargs['implicit_safe']
+        propagate = True
+    if 'pyyaml_node' in kwargs:
+        node._pyyaml_node = kwargs['pyyaml_node']
+    if propagate:
+        node._propagate_implicit_values()
+
+
+def _deduce_node_type(value):
+    value_type = type(value)
+    t = _deduced_types.get(value_type)
+    if t is None:
+        if _ConfigScalar is None:
+            _import_deduced_types()
+            t = _deduced_types.get(value_type)
+
+    if t is None:
+        # concrete checks first, the abstract ones are much slower
+        if isinstance(value, (str, bytes)):
+            t = _ConfigScalar
+        elif isinstance(value, cabc.Sequence):
+            if isinstance(value, cabc.MutableSequence):
+                t = _ConfigList
+            else:
+                t = _ConfigTuple
+        elif isinstance(value, cabc.MutableMapping):
+            t = _ConfigDict
+        else:
+            t = _ConfigScalar
+
+        _deduced_types[value_type] = t
+
+    return t
+
+
+class _EmptyMetadata(dict):
+    ''' An immutable empty dict shared by all nodes without metadata.
+    '''
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('Shared empty metadata cannot be modified')
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    setdefault = update = pop = popitem = clear = _readonly
+
+    def __reduce__(self):
+        return '_empty_metadata'
+
+
+_empty_metadata = _EmptyMetadata()
+
+
+class _DefaultFilename(threading.local):
+    # used until a thread sets its own value
+    value = None
+
+
+class _DefaultSafe(threading.local):
+    # used until a thread sets its own value
+    value = False
+
+
 class ConfigNodeMeta(NamespaceableMeta):
+    def __init__(cls, clsname, clsbases, clsnamespace, **kwargs):
+        super().__init__(clsname, clsbases, clsnamespace, **kwargs)
+        cls._repr_prefix = f'<Object {clsname!r} at 0x'
+
     def __call__(cls,
             *args,
             nodes_memo=None,
@@ -71,44 +175,26 @@ class ConfigNodeMeta(NamespaceableMeta):
             # deduce type and call it recursively (this time enforcing it)
             if not has_value:
                 raise ValueError('Cannot deduce target type without a positional argument - deduction is always done w.r.t. the first argument')
-            if isinstance(value, ConfigNode):
-                for arg_name in _kwargs_to_inherit:
-                    if arg_name in kwargs:
-                        # do not change implicit_safe if already set to False
-                        if arg_name == 'implicit_safe' and getattr(value, '_' + arg_name) is False:
-                            del kwargs[arg_name]
-                            continue
-                        setattr(value, '_' + arg_name, kwargs[arg_name])
-                if any(k.startswith('implicit_') for k in kwargs.keys()):
-                    value._propagate_implicit_values()
-
+            if getattr(value, '_is_config_node', False) is True:
+                if kwargs:
+                    _inherit_kwargs(value, kwargs)
                 return value
             else:
-                from .dict import ConfigDict
-                from .list import ConfigList
-                from .tuple import ConfigTuple
-                from .scalar import ConfigScalar
-
-                if isinstance(value, cabc.Sequence) and not isinstance(value, str) and not isinstance(value, bytes):
-                    if isinstance(value, cabc.MutableSequence):
-                        t = ConfigList
-                    else:
-                        t = ConfigTuple
-                elif isinstance(value, cabc.MutableMapping):
-                    t = ConfigDict
-                else:
-                    t = ConfigScalar
+                t = _deduce_node_type(value)
 
             # dispatch actual object creation (see below)
             # we need to do that recursively since __call__ method can be overwritten (e.g. ConfigScalar)
+            if not args and not kwargs:
+                return t._fast_call(value, nodes_memo)
             return t(value, *args, nodes_memo=nodes_memo, _force_type=True, **kwargs)
 
         # actual object creation
-        if has_value and nodes_memo is not None and id(value) in nodes_memo:
-            return nodes_memo[id(value)]
+        if has_value and nodes_memo is not None:
+            ret = nodes_memo.get(id(value))
+            if ret is not None:
+                return ret
 
-        from .composed import ComposedNode
-        if issubclass(cls, ComposedNode):
+        if cls._is_composed():
             kwargs['nodes_memo'] = nodes_memo
 
         if has_value:
@@ -123,23 +209,57 @@ class ConfigNodeMeta(NamespaceableMeta):
 
         return ret
 
+    def _fast_call(cls, value, nodes_memo):
+        ''' Equivalent to ``cls(value, nodes_memo=nodes_memo, _force_type=True)``
+            for the common case when no extra arguments are passed, skipping
+            the generic handling of ``*args`` and ``**kwargs``.
+        '''
+        if nodes_memo is not None:
+            ret = nodes_memo.get(id(value))
+            if ret is not None:
+                return ret
+
+        if cls._is_composed():
+            ret = NamespaceableMeta.__call__(cls, value, nodes_memo=nodes_memo)
+        else:
+            ret = NamespaceableMeta.__call__(cls, value)
+
+        if nodes_memo is not None:
+            assert id(value) not in nodes_memo
+            nodes_memo[persistent_id(value)] = ret
+
+        return ret
+
+    def _fast_new(cls, value, **kwargs):
+        ''' Creates a new node holding ``value``, which should not be a config node itself.
+            Unlike ``cls(value, **kwargs)`` no memoization is done and the node's type
+            is only deduced if ``cls`` is ``ConfigNode``.
+        '''
+        if cls is ConfigNode:
+            return _deduce_node_type(value)._fast_new(value, **kwargs)
+        return NamespaceableMeta.__call__(cls, value, **kwargs)
+
 
 class ConfigNode(metaclass=ConfigNodeMeta):
-    WEAK = -1
-    STANDARD = 0
-    FORCE = 1
+    WEAK = _weak_priority
+    STANDARD = _standard_priority
+    FORCE = _force_priority
+
+    # cheaper alternative to isinstance(obj, ConfigNode) for hot paths, use as:
+    # getattr(obj, '_is_config_node', False) is True
+    _is_config_node = True
 
-    special_metadata_names = [
+    special_metadata_names = frozenset([
         'idx',
         'priority',
         'delete',
         'allow_new',
         'source_file',
         'safe'
-    ]
+    ])
 
-    _default_filename = threading.local()
-    _default_safe = threading.local()
+    _default_filename = _DefaultFilename()
+    _default_safe = _DefaultSafe()
     _default_priority = STANDARD
     _default_delete = False
     _default_allow_new = True
@@ -147,9 +267,6 @@ class ConfigNode(metaclass=ConfigNodeMeta):
     @staticmethod
     @contextlib.contextmanager
     def default_filename(filename):
-        if not hasattr(ConfigNode._default_filename, 'value'):
-            ConfigNode._default_filename.value = None
-
         old = ConfigNode._default_filename.value
         ConfigNode._default_filename.value = filename
         try:
@@ -160,7 +277,8 @@ class ConfigNode(metaclass=ConfigNodeMeta):
     @staticmethod
     @contextlib.contextmanager
     def default_safe_flag(value):
-        if not hasattr(ConfigNode._default_safe, 'value'):
+        # the class-level fallback only applies to nodes, the outermost call should start from True
+        if 'value' not in ConfigNode._default_safe.__dict__:
             ConfigNode._default_safe.value = True
 
         old = ConfigNode._default_safe.value
@@ -179,7 +297,11 @@ class ConfigNode(metaclass=ConfigNodeMeta):
                  - merging flags inherited from a parent node (aka implicit flags) - these can only have not-None value if there's an ancestor node with explicit flag, however the immediate parent does not have to have a flag specified explicitly
                  - a node type's defaults
         """
-        if priority not in [None, ConfigNode.STANDARD, ConfigNode.WEAK, ConfigNode.FORCE]:
+        try:
+            valid = priority in _valid_priorities
+        except TypeError: # unhashable
+            valid = False
+        if not valid:
             raise ValueError(f'Unknown priority value: {priority}')
         self._idx = idx
         self._priority = priority
@@ -187,15 +309,15 @@ class ConfigNode(metaclass=ConfigNodeMeta):
         self._allow_new = allow_new
         self._implicit_delete = implicit_delete
         self._implicit_allow_new = implicit_allow_new
-        self._source_file = source_file if source_file is not None else getattr(ConfigNode._default_filename, 'value', None)
-        self._metadata = metadata or {}
+        self._source_file = source_file if source_file is not None else ConfigNode._default_filename.value
+        self._metadata = metadata or _empty_metadata
         self._pyyaml_node = pyyaml_node
         self._safe = safe
         self._implicit_safe = implicit_safe
-        self._default_safe = getattr(ConfigNode._default_safe, 'value', False)
+        self._default_safe = ConfigNode._default_safe.value
 
     def __repr__(self, simple=False):
-        return f'<Object {type(self).__name__!r} at 0x{id(self):02x}>'
+        return f'{self._repr_prefix}{id(self):02x}>'
 
     class ayns(Namespace):
         @property
@@ -204,33 +326,23 @@ class ConfigNode(metaclass=ConfigNodeMeta):
 
         @property
         def priority(self):
-            if self._priority is None:
-                return self._default_priority
-
-            return self._priority
+            return self._get_priority()
 
         @property
         def weak(self):
-            return self.ayns.priority == ConfigNode.WEAK
+            return self._get_priority() == _weak_priority
 
         @property
         def force(self):
-            return self.ayns.priority == ConfigNode.FORCE
+            return self._get_priority() == _force_priority
 
         @property
         def delete(self):
-            if self._delete is None:
-                if self._implicit_delete is not None:
-                    return self._implicit_delete
-                return self._default_delete
-
-            return self._delete
+            return self._get_delete()
 
         @property
         def allow_new(self):
-            if self._implicit_allow_new is not None:
-                return self._implicit_allow_new
-            return self._default_allow_new
+            return self._get_allow_new()
 
         @property
         def explicit_delete(self):
@@ -242,11 +354,11 @@ class ConfigNode(metaclass=ConfigNodeMeta):
 
         @property
         def metadata(self):
-            return self._metadata
+            return self._get_own_metadata()
 
         @property
         def safe(self):
-            return notnone_or(self._safe, True) and notnone_or(self._implicit_safe, True) and notnone_or(self._default_safe, False)
+            return self._get_safe()
 
         @staticproperty
         @staticmethod
@@ -276,9 +388,11 @@ class ConfigNode(metaclass=ConfigNodeMeta):
             return None
 
         def has_priority_over(self, other, if_equal=False):
-            if self.ayns.priority == other.ayns.priority:
+            priority = self._get_priority()
+            other_priority = other._get_priority()
+            if priority == other_priority:
                 return if_equal
-            return self.ayns.priority > other.ayns.priority
+            return priority > other_priority
 
 
         #
@@ -314,7 +428,7 @@ class ConfigNode(metaclass=ConfigNodeMeta):
 
         def merge(self, other):
             if other is None:
-                if not self.ayns.allow_new:
+                if not self._get_allow_new():
                     raise ValueError('A top-level destination node does not exist but this top-level node has a !notnew flag enabled!')
                 return self
 
@@ -336,8 +450,7 @@ class ConfigNode(metaclass=ConfigNodeMeta):
         @rethrow_as_eval_error
         def on_evaluate(self, path, root):
             evaluated = self.ayns.on_evaluate_impl(path, root)
-            assert evaluated is not self
-            assert not isinstance(evaluated, ConfigNode)
+            assert evaluated is not self and not isinstance(evaluated, ConfigNode)
             return evaluated
 
         def on_evaluate_impl(self, path, ctx):
@@ -352,12 +465,13 @@ class ConfigNode(metaclass=ConfigNodeMeta):
             # Note that "priority" and "delete" might be optimized out from the dump output if
             # they would be set by the parent (dumping function holds a stack of which metadata are "default"
             # and does not produce anything which is aligned with the defaults)
-            ret = copy.copy(self._metadata)
-            ret['priority'] = self._priority
-            ret['delete'] = self._delete #if not self._implicit_delete else None
-            ret['allow_new'] = self._allow_new
-            ret['safe'] = self._safe
-            return ret
+            return {
+                **self._metadata,
+                'priority': self._priority,
+                'delete': self._delete, #if not self._implicit_delete else None
+                'allow_new': self._allow_new,
+                'safe': self._safe
+            }
 
         @property
         def node_info(self):
@@ -372,7 +486,7 @@ class ConfigNode(metaclass=ConfigNodeMeta):
                 'implicit_safe': self._implicit_safe,
                 'default_safe': self._default_safe,
                 'source_file': self._source_file,
-                'metadata': self._metadata
+                'metadata': self._get_own_metadata()
             }
 
         def get_default_mode(self):
@@ -389,18 +503,49 @@ class ConfigNode(metaclass=ConfigNodeMeta):
                 and ``data`` is object which will be used to recursively represent ``self`` (can be either
                 mapping, sequence or scalar).
             '''
-            return self.ayns.tag, self.ayns.get_node_info_to_save(), self.ayns.value
+            ayns = self.ayns
+            return ayns.tag, ayns.get_node_info_to_save(), ayns.value
 
         def _require_all_new(self, path, reason, exceptions=None, include_self=True):
             if not include_self:
                 return
-            if not self.ayns.allow_new and (exceptions is None or path not in exceptions):
+            if not self._get_allow_new() and (exceptions is None or path not in exceptions):
                 raise ValueError(f'Node {path!r} (source file: {self._source_file!r}) requires that the destination already exists but the current config tree does not contain a node under this path ({reason})')
 
         def _require_safe(self, path):
-            if not self.ayns.safe:
+            if not self._get_safe():
                 raise errors.UnsafeError(None, self, path)
 
+    def _get_own_metadata(self):
+        # the shared empty metadata is replaced with a new dict before it is exposed, so that it can be modified
+        if self._metadata is _empty_metadata:
+            self._metadata = {}
+        return self._metadata
+
+    def _get_priority(self):
+        if self._priority is None:
+            return self._default_priority
+
+        return self._priority
+
+    def _get_delete(self):
+        if self._delete is None:
+            if self._implicit_delete is not None:
+                return self._implicit_delete
+            return self._default_delete
+
+        return self._delete
+
+    def _get_allow_new(self):
+        if self._implicit_allow_new is not None:
+            return self._implicit_allow_new
+        return self._default_allow_new
+
+    def _get_safe(self):
+        if self._safe is False or self._implicit_safe is False:
+            return False
+        return notnone_or(self._default_safe, False)
+
     def _propagate_implicit_values(self):
         return
 
@@ -434,10 +579,12 @@ class ConfigNode(metaclass=ConfigNodeMeta):
         self._priority = other._priority
         self._delete = other._delete
         if other._safe is not None:
-            self._safe = notnone_or(self._safe, True) and other._safe
+            self._safe = (self._safe is None or self._safe) and other._safe
         if other._default_safe is not None:
-            self._default_safe = notnone_or(other._default_safe, True) and other._default_safe
-        self._metadata = { **self._metadata, **other._metadata }
+            self._default_safe = other._default_safe
+        if other._metadata:
+            # metadata dicts can be shared between nodes (e.g. after promotion) so never update them in-place
+            self._metadata = { **self._metadata, **other._metadata }
         if allow_promotions:
             ret = self._maybe_promote(other)
         else:
@@ -457,10 +604,11 @@ class ConfigNode(metaclass=ConfigNodeMeta):
             with any extra content coming from other's type preserved.
         '''
         if other._safe is not None:
-            self._safe = notnone_or(self._safe, True) and other._safe
+            self._safe = (self._safe is None or self._safe) and other._safe
         if other._default_safe is not None:
-            self._default_safe = notnone_or(other._default_safe, True) and other._default_safe
-        self._metadata = { **other._metadata, **self._metadata }
+            self._default_safe = other._default_safe
+        if other._metadata:
+            self._metadata = { **other._metadata, **self._metadata }
         if allow_promotions:
             return self._maybe_promote(other)
         return self
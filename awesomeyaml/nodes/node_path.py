@@ -3,70 +3,176 @@ import collections.abc as cabc
 
 
 class NodePath(list):
-    _path_component_regex = re.compile(r'''
-                # the available options are:
-                    (?:^|(?<=\.)) # ...if it is either at the beginning or preceded by a dot (do not capture)
-                    ( [a-zA-Z0-9_]+ ) # a textual identifier (captured by the fist capture group)
-                | # OR...
-                    \[ (-?[0-9]+) \] # a (possibly negative) integer in [] (with second capture group catching the integer inside)
-                | # OR...
-                    (?<!^) # ... if it's not the first character ...
-                    \. # a single dot
-                    (?:(?!$)(?!\.)(?!\[)) # ... does not appear at the end and is not followed by either another dot or [ (do not capture)
-                ''', re.VERBOSE) # verbose flag enables us to have comments, whitespace (inc. multi-line) etc. for better readability
+    ''' A list of names (str) and indices (int) identifying a node within a config tree.
+
+        The joined string form of a path (see `get_str_path`) is computed lazily and cached,
+        it is also used to hash paths. All mutating list methods invalidate the cache, but a
+        path should not be modified while it is used as a key of a dict or a member of a set.
+        Paths derived with `child` or ``+`` reuse the cached string of the original path.
+    '''
+    # the available options are: a textual identifier (first capture group), a (possibly negative) integer
+    # in [] (second capture group) or a single dot (third capture group) - additional constraints about
+    # where each of them can appear are checked by `_is_valid_component`
+    _path_component_regex = re.compile(r'([a-zA-Z0-9_]+)|\[(-?[0-9]+)\]|(\.)')
+
+    # joined string form of the path, computed lazily and reset whenever the path is modified
+    _str_cache = None
 
     def __str__(self):
-        return self.get_str_path(self)
+        if self._str_cache is None:
+            self._str_cache = self.join_path(self)
+        return self._str_cache
 
     def __repr__(self):
         return repr(self.__str__())
 
     def __add__(self, other):
-        return NodePath(list.__add__(self, other))
+        ret = NodePath(list.__add__(self, other))
+        prefix = self._get_str_prefix()
+        if prefix is not None:
+            ret._str_cache = self._extend_str(prefix, other)
+        return ret
 
     def __hash__(self):
-        return hash(str(self))
+        return hash(self.__str__())
+
+    def __setitem__(self, index, value):
+        self._str_cache = None
+        return list.__setitem__(self, index, value)
+
+    def __delitem__(self, index):
+        self._str_cache = None
+        return list.__delitem__(self, index)
+
+    def __iadd__(self, other):
+        prefix = self._get_str_prefix()
+        if prefix is not None and isinstance(other, (list, tuple)):
+            list.__iadd__(self, other)
+            self._str_cache = self._extend_str(prefix, other)
+            return self
+        self._str_cache = None
+        return list.__iadd__(self, other)
+
+    def __imul__(self, other):
+        self._str_cache = None
+        return list.__imul__(self, other)
+
+    def append(self, value):
+        self._str_cache = None
+        return list.append(self, value)
+
+    def extend(self, other):
+        self._str_cache = None
+        return list.extend(self, other)
+
+    def insert(self, index, value):
+        self._str_cache = None
+        return list.insert(self, index, value)
+
+    def pop(self, *args):
+        self._str_cache = None
+        return list.pop(self, *args)
+
+    def remove(self, value):
+        self._str_cache = None
+        return list.remove(self, value)
+
+    def clear(self):
+        self._str_cache = None
+        return list.clear(self)
+
+    def reverse(self):
+        self._str_cache = None
+        return list.reverse(self)
+
+    def sort(self, *args, **kwargs):
+        self._str_cache = None
+        return list.sort(self, *args, **kwargs)
+
+    def child(self, component):
+        ''' Equivalent to ``self + [component]`` but the new path reuses
+            the cached string form of ``self``, if available.
+        '''
+        ret = NodePath(self)
+        list.append(ret, component)
+        prefix = self._get_str_prefix()
+        if prefix is not None:
+            ret._str_cache = self._extend_str(prefix, (component, ))
+        return ret
+
+    def _get_str_prefix(self):
+        if self._str_cache is None and not self:
+            return ''
+        return self._str_cache
+
+    @classmethod
+    def _extend_str(cls, prefix, components):
+        ''' Returns the string form of a path whose string form is ``prefix``
+            after ``components`` have been appended to it (see `join_path`).
+        '''
+        for component in components:
+            if isinstance(component, int):
+                prefix = f'{prefix}[{component}]'
+            elif prefix:
+                prefix = f'{prefix}.{component}'
+            else:
+                prefix = str(component)
+        return prefix
+
+    @classmethod
+    def _is_valid_component(cls, path_str, match):
+        start = match.start()
+        if match.group(1):
+            # identifiers can only appear either at the beginning or after a dot
+            return start == 0 or path_str[start-1] == '.'
+        if match.group(3):
+            # dots cannot appear at the beginning or at the end and cannot be followed by another dot or [
+            end = match.end()
+            return start != 0 and end != len(path_str) and path_str[end] not in '.['
+        return True
 
     @classmethod
     def split_path(cls, path_str, validate=True):
-        matches = cls._path_component_regex.finditer(path_str)
-        if validate:
-            _matches_cache = []
-            beg = None
-            end = None
-            for match in matches:
-                _matches_cache.append(match)
-                if beg is None:
-                    beg = match.start()
-                # in the first iteration, check is beg (i.e. match.start()) == 0 to make sure we do not have an invalid prefix
-                # in every other iteration make sure the new match strictly follow the previous one, if it doesn't that means
-                # that there was an invalid part between them (invalid here means not matching our regular expression)
-                if match.start() != (end if end is not None else 0):
+        components = []
+        append = components.append
+        match_component = cls._path_component_regex.match
+        is_valid = cls._is_valid_component
+        pos = 0
+        end = len(path_str)
+        while pos < end:
+            match = match_component(path_str, pos)
+            if match is None or not is_valid(path_str, match):
+                # either an invalid character or a valid one in an invalid place
+                if validate:
                     raise ValueError(f'Invalid path: {path_str!r}')
-                end = match.end()
-
-            # the path is fine at the beginning and internally doesn't have any "gaps" but has an incorrect suffix
-            # (i.e. a part at the end which doesn't match our regular expression)
-            if path_str and end != len(path_str):
-                raise ValueError(f'Invalid path: {path_str!r}')
-
-            matches = _matches_cache
-        
-        for match in matches:
-            if match.group(1): # name
-                yield str(match.group(1))
-            elif match.group(2):  # index
-                yield int(match.group(2))
-            else:
-                # sanity check
-                assert match.group(0) == '.'
+                pos += 1
+                continue
+
+            kind = match.lastindex
+            if kind == 1: # name
+                append(match.group(1))
+            elif kind == 2:  # index
+                append(int(match.group(2)))
+
+            pos = match.end()
+
+        yield from components
 
     @classmethod
     def join_path(cls, path_list):
-        ret = ''
+        parts = []
         for component in path_list:
-            ret = ret + cls._get_child_accessor(component, ret)
-        return ret
+            if isinstance(component, int):
+                parts.append(f'[{component}]')
+            elif parts:
+                parts.append(f'.{component}')
+            else:
+                # only non-empty parts are stored so `parts` being non-empty is equivalent to
+                # the joined prefix being non-empty
+                component = str(component)
+                if component:
+                    parts.append(component)
+        return ''.join(parts)
 
     @classmethod
     def _get_child_accessor(cls, childname, myname=''):
@@ -82,6 +188,9 @@ class NodePath(list):
             if not isinstance(path[0], int):
                 path = path[0]
 
+        if type(path) is NodePath:
+            # already normalized, the caller is not expected to modify it
+            return path
         if path is None:
             return NodePath()
         if not isinstance(path, cabc.Sequence) or isinstance(path, str):
@@ -102,6 +211,8 @@ class NodePath(list):
         if len(path) == 1:
             path = path[0]
 
+        if type(path) is NodePath:
+            return path.__str__()
         if path is None:
             return ''
         if isinstance(path, int):
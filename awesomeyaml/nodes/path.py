@@ -15,6 +15,7 @@
 import os
 import re
 import pathlib
+import functools
 
 from .list import ConfigList
 from .node import ConfigNode
@@ -22,8 +23,30 @@ from ..namespace import namespace, staticproperty
 
 from collections.abc import Sequence
 
-_parent_regexp = re.compile(r'parent(\(([0-9]+)\))?')
-_abs_regexp = re.compile(r'abs\(([a-zA-Z0-9_/\ -.]+)\)')
+_simple_ref_points = { '': ('', None), 'cwd': ('cwd', None), 'file': ('file', None), 'parent': ('parent', 0) }
+_is_parent_idx = re.compile(r'[0-9]+').fullmatch
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_ref_point(ref_point):
+    ''' Returns a tuple ``(ref_point, args)`` for a reference point string or ``None``
+        if it is not valid. The same strings tend to repeat a lot so results are cached.
+    '''
+    ret = _simple_ref_points.get(ref_point)
+    if ret is not None:
+        return ret
+
+    if not ref_point.endswith(')'):
+        return None
+
+    if ref_point.startswith('parent('):
+        idx = ref_point[7:-1]
+        if _is_parent_idx(idx):
+            return 'parent', int(idx)
+    elif ref_point.startswith('abs(') and len(ref_point) > 5:
+        return 'abs', ref_point[4:-1]
+
+    return None
 
 
 class PathNode(ConfigList):
@@ -87,21 +110,7 @@ class PathNode(ConfigList):
 
         self.ref_point = ref_point or ''
 
-        self._ref_point_parsed = None
-        if self.ref_point not in ['', 'cwd', 'file']:
-            parent_match = _parent_regexp.match(self.ref_point)
-            abs_match = _abs_regexp.match(self.ref_point)
-            assert not parent_match or not abs_match
-            if parent_match:
-                idx = 0
-                if parent_match.group(2):
-                    idx = int(parent_match.group(2))
-                self._ref_point_parsed = 'parent', idx
-            elif abs_match:
-                self._ref_point_parsed = 'abs', str(abs_match.group(1))
-        else:
-            self._ref_point_parsed = self.ref_point, None
-
+        self._ref_point_parsed = _parse_ref_point(self.ref_point)
         if not self._ref_point_parsed:
             raise ValueError(f'Unknown reference point provided for a PathNode: {ref_point!r}.')
 
@@ -109,32 +118,47 @@ class PathNode(ConfigList):
     def on_evaluate_impl(self, path, ctx):
         args = super().ayns.on_evaluate_impl(path, ctx)
         ref_point, ref_point_args = self._ref_point_parsed
-        if ref_point == '':
-            ret = pathlib.Path('.').joinpath(*args)
-        elif ref_point == 'cwd':
-            ret = pathlib.Path(os.getcwd()).joinpath(*args)
-        elif ref_point == 'file':
-            if self.ayns.source_file is None:
-                raise ValueError('!path node with :file reference requires to know source file of the node, but the node is missing this information')
-            ret = pathlib.Path(self.ayns.source_file).joinpath(*args)
-        elif ref_point == 'parent':
-            if self.ayns.source_file is None:
-                raise ValueError('!path node with :parent reference requires to know source file of the node, but the node is missing this information')
-            src = pathlib.Path(self.ayns.source_file)
-            if ref_point_args >= len(src.parents):
-                diff = ref_point_args - len(src.parents) + 1
-                ref_point_args = len(src.parents) - 1
-                args = ['..'] * diff + args
-
-            ret = src.parents[ref_point_args].joinpath(*args)
-        elif ref_point == 'abs':
-            ret = pathlib.Path(ref_point_args).joinpath(*args)
-        else:
+        evaluate = self._ref_point_evaluators.get(ref_point)
+        if evaluate is None:
             raise ValueError(f'Unknown reference point: {ref_point!r}')
 
-        ret = pathlib.Path(os.path.normpath(ret))
+        # all joins are done on strings, only the final result is converted to a Path
+        ret = pathlib.Path(os.path.normpath(evaluate(self, ctx, args, ref_point_args)))
         return ret
 
+    def _evaluate_implicit(self, ctx, args, ref_point_args):
+        return os.path.join('.', *args)
+
+    def _evaluate_cwd(self, ctx, args, ref_point_args):
+        return os.path.join(ctx.get_cwd(), *args)
+
+    def _evaluate_file(self, ctx, args, ref_point_args):
+        if self._source_file is None:
+            raise ValueError('!path node with :file reference requires to know source file of the node, but the node is missing this information')
+        return os.path.join(self._source_file, *args)
+
+    def _evaluate_parent(self, ctx, args, ref_point_args):
+        if self._source_file is None:
+            raise ValueError('!path node with :parent reference requires to know source file of the node, but the node is missing this information')
+        src = pathlib.Path(self._source_file)
+        if ref_point_args >= len(src.parents):
+            diff = ref_point_args - len(src.parents) + 1
+            ref_point_args = len(src.parents) - 1
+            args = ['..'] * diff + args
+
+        return os.path.join(src.parents[ref_point_args], *args)
+
+    def _evaluate_abs(self, ctx, args, ref_point_args):
+        return os.path.join(ref_point_args, *args)
+
+    _ref_point_evaluators = {
+        '': _evaluate_implicit,
+        'cwd': _evaluate_cwd,
+        'file': _evaluate_file,
+        'parent': _evaluate_parent,
+        'abs': _evaluate_abs
+    }
+
 
     @namespace('ayns')
     @property
@@ -67,10 +67,16 @@ class RecurseNode(ConfigList):
 
         missing = []
         builder = Builder()
+        lookup_dirs = list(builder.get_lookup_dirs(self._source_file))
         for safe, filename in zip(safe_flags, value):
             found = False
-            for lookup_dir in builder.get_lookup_dirs(self._source_file):
-                file = os.path.normpath(os.path.join(lookup_dir, filename))
+            if os.path.isabs(filename):
+                # lookup dirs would be ignored by os.path.join anyway
+                candidates = [os.path.normpath(filename)]
+            else:
+                candidates = [os.path.normpath(os.path.join(lookup_dir, filename)) for lookup_dir in lookup_dirs]
+
+            for file in candidates:
                 try:
                     builder.add_source(file, raw_yaml=False, safe=safe)
                     found = True
@@ -84,7 +90,7 @@ class RecurseNode(ConfigList):
                 missing.append(filename)
 
         if missing:
-            raise FileNotFoundError({ 'missing': missing, 'lookup_dirs': list(builder.get_lookup_dirs(self._source_file)), 'source': self._source_file })
+            raise FileNotFoundError({ 'missing': missing, 'lookup_dirs': lookup_dirs, 'source': self._source_file })
 
         cfgobj = builder.build()
 
@@ -104,6 +110,8 @@ class RecurseNode(ConfigList):
         return '!rec'
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, RecurseNode):
             return self._source_file == other._source_file and list.__eq__(self, other)
         return False
@@ -69,39 +69,60 @@ class ConfigScalarMeta(ConfigNodeMeta):
         super().__init__(name, bases, dict, **kwargs)
         cls._bases = bases
         cls._dict = dict
+        # only true for the types created by ConfigScalar(...), not inherited by their subclasses
+        cls._is_dynamic = dict.get('_is_dynamic', False)
 
     def __call__(cls, value, **kwargs):
         if cls is not ConfigScalar:
             return super().__call__(value, **kwargs)
 
-        type_only = False
         if isinstance(value, type):
-            value_type = value
-            type_only = True
-        else:
-            value_type = type(value)
+            return cls._get_node_type(value)
+
+        ret = ConfigNodeMeta.__call__(cls._get_node_type(type(value)), value, **kwargs)
+        return ret
+
+    def _get_node_type(cls, value_type):
+        ''' Returns a type of scalar nodes holding values of type ``value_type``.
+        '''
+        # fast path: a dynamic type has already been created for value_type (or its alias)
+        ret = ConfigScalarMeta._types.get(value_type)
+        if ret is not None:
+            return ret
+
+        if issubclass(value_type, ConfigScalarMarker):
+            return value_type
 
+        alias = value_type
         if value_type not in ConfigScalarMeta._allowed_scalar_types and value_type in ConfigScalarMeta._rev_scalar_types:
             value_type = ConfigScalarMeta._rev_scalar_types[value_type]
 
-        if not issubclass(value_type, ConfigScalarMarker):
+        ret = ConfigScalarMeta._types.get(value_type)
+        if ret is None:
             #if value_type not in cls._allowed_scalar_types:
             #    raise ValueError(f'Unsupported scalar type: {value_type}')
             typename = f'ConfigScalar({value_type.__name__})'
-            if value_type not in cls._types:
-                #bt = cls._allowed_scalar_types[value_type]
-                bt = cls._allowed_scalar_types.get(value_type, value_type)
-                new_value_type = ConfigScalarMeta(typename, cls._bases + (bt, ), { **cls._dict, '_dyn_base': bt } )
-                cls._types[value_type] = new_value_type
-                value_type = new_value_type
-            else:
-                value_type = cls._types[value_type]
-
-        if type_only:
-            return value_type
-        ret = ConfigNodeMeta.__call__(value_type, value, **kwargs)
+            bt = ConfigScalarMeta._allowed_scalar_types.get(value_type, value_type)
+            # most (incl. all builtin) types are fully initialized by __new__, in which case there is no need to call __init__
+            bt_init = bt.__init__ if bt.__init__ is not object.__init__ else None
+            ret = ConfigScalarMeta(typename, cls._bases + (bt, ), { **cls._dict, '_dyn_base': bt, '_dyn_base_init': bt_init, '_is_dynamic': True } )
+            ConfigScalarMeta._types[value_type] = ret
+
+        # remember aliases (e.g. configbool for bool) so that they also take the fast path
+        ConfigScalarMeta._types[alias] = ret
         return ret
 
+    def _fast_call(cls, value, nodes_memo):
+        if cls is ConfigScalar:
+            # the actual type has to be resolved first
+            return cls(value, nodes_memo=nodes_memo)
+        return super()._fast_call(value, nodes_memo)
+
+    def _fast_new(cls, value, **kwargs):
+        if cls is ConfigScalar:
+            cls = cls._get_node_type(type(value))
+        return super()._fast_new(value, **kwargs)
+
     def __instancecheck__(cls, obj):
         if cls is ConfigScalar:
             return isinstance(obj, ConfigScalarMarker)
@@ -129,13 +150,15 @@ class ConfigScalar(ConfigScalarMarker, metaclass=ConfigScalarMeta):
 
     def __init__(self, value, **kwargs):
         ConfigNode.__init__(self, **kwargs)
-        try:
-            self._dyn_base.__init__(self, value, **kwargs)
-        except:
+        base_init = type(self)._dyn_base_init
+        if base_init is not None:
             try:
-                self._dyn_base.__init__(self, value)
+                base_init(self, value, **kwargs)
             except:
-                self._dyn_base.__init__(self) # pylint: disable=no-member
+                try:
+                    base_init(self, value)
+                except:
+                    base_init(self)
 
     def __repr__(self, simple=False):
         if simple:
@@ -181,7 +204,7 @@ class ConfigScalar(ConfigScalarMarker, metaclass=ConfigScalarMeta):
         return self._dyn_base(self) # pylint: disable=no-member
 
     def _is_primary_type_dynamic(self):
-        return type(self).__mro__[0] in ConfigScalar._types.values()
+        return type(self)._is_dynamic
 
     def __reduce__(self):
         if not self._is_primary_type_dynamic():
@@ -32,5 +32,6 @@ class StreamNode(ConfigList):
     def on_premerge_impl(self, path, into):
         self.clear()
         self.builder.flatten()
-        self.append(self.builder.stages[0])
-        return self.builder.stages[0].ayns.on_premerge(path, into)
+        stage0 = self.builder.stages[0]
+        self.append(stage0)
+        return stage0.ayns.on_premerge(path, into)
@@ -19,24 +19,30 @@ from ..namespace import namespace
 
 
 class ConfigTuple(ComposedNode, tuple):
-    def __new__(cls, value, **kwargs):
+    def __new__(cls, value, nodes_memo=None, **kwargs):
         from .node import ConfigNode
-        value = value if value is not None else tuple()
-        return tuple.__new__(cls, tuple(ConfigNode(child) for child in value))
+        if not value:
+            return tuple.__new__(cls)
+        # children are created here, with the same arguments ComposedNode.__init__ would pass to them
+        for name in ('idx', 'metadata', 'delete', 'allow_new', 'safe'):
+            kwargs.pop(name, None)
+        nodes_memo = nodes_memo if nodes_memo is not None else {}
+        return tuple.__new__(cls, [ConfigNode(child, **kwargs, nodes_memo=nodes_memo) for child in value])
 
     def __init__(self, value=None, **kwargs):
-        value = value if value is not None else tuple()
         #ComposedNode.maybe_inherit_flags(value, kwargs)
         kwargs.setdefault('delete', True)
-        ComposedNode.__init__(self, children={ i: v for i, v in enumerate(value) }, **kwargs)
+        # children have already been created by __new__, this only passes the implicit flags to them
+        ComposedNode.__init__(self, children=dict(enumerate(tuple.__iter__(self))), **kwargs)
 
     def _validate_index(self, index):
         if not isinstance(index, int):
             raise TypeError(f'Index should be integer, got: {type(index)}')
-        if abs(index) >= len(self):
+        n = len(self)
+        if index >= n or index < -n:
             raise IndexError('Tuple index out of range')
         if index < 0:
-            index = len(self) + index
+            index += n
 
         return index
 
@@ -74,7 +80,7 @@ class ConfigTuple(ComposedNode, tuple):
         return tuple.__contains__(self, value)
 
     def __repr__(self, simple=False):
-        tuple_repr = '(' + ', '.join([c.__repr__(simple=True) for c in self.ayns.children()]) + ')' # pylint: disable=no-value-for-parameter
+        tuple_repr = '(' + ', '.join([c.__repr__(simple=True) for c in tuple.__iter__(self)]) + ')'
         if simple:
             return type(self).__name__ + tuple_repr
 
@@ -82,7 +88,13 @@ class ConfigTuple(ComposedNode, tuple):
         return node + tuple_repr
 
     def __str__(self):
-        return type(self).__name__ + '(' ', '.join(map(str, self)) + ')'
+        ret = self.__dict__.get('_str_cache')
+        if ret is None:
+            ret = type(self).__name__ + '(' + ', '.join(map(str, self)) + ')'
+            # mutable children (e.g. lists) can change their string form, only cache if there are none
+            if not any(c._is_composed() for c in tuple.__iter__(self)):
+                self._str_cache = ret
+        return ret
 
     def _get_value(self):
         return self
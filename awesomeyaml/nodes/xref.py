@@ -23,19 +23,30 @@ class XRefNode(ConfigScalar(str)):
 
     @namespace('ayns')
     def on_evaluate_impl(self, path, ctx):
+        key = str(self)
+        if key in ctx._xref_cache:
+            return ctx._xref_cache[key]
+
         chain = [NodePath.get_str_path(path)]
+        seen = set(chain)
         curr = self
         while isinstance(curr, XRefNode):
+            target = str(curr)
+            if target in seen:
+                raise ValueError(f'Cyclic chain of references detected: {" -> ".join(chain + [target])}')
             try:
-                ref = ctx.get_node(curr)
+                ref = ctx.get_node(target)
             except KeyError:
-                msg = f'Referenced node {str(curr)!r} is missing, while following a chain of references: {chain}'
+                msg = f'Referenced node {target!r} is missing, while following a chain of references: {chain}'
                 raise ValueError(msg) from None
 
-            chain.append(str(curr))
+            chain.append(target)
+            seen.add(target)
             curr = ref
         assert curr is not self
-        return ctx.evaluate_node(curr, prefix=chain[-1])
+        ret = ctx.evaluate_node(curr, prefix=chain[-1])
+        ctx._xref_cache[key] = ret
+        return ret
 
     @namespace('ayns')
     @staticproperty
@@ -13,6 +13,13 @@
 # limitations under the License.
 
 import sys
+import builtins
+import importlib
+import weakref
+import functools
+import traceback
+
+from collections.abc import MutableMapping
 
 
 class persistent_id(int):
@@ -27,7 +34,8 @@ class persistent_id(int):
         The downside of this approach is the fact that the objects will
         remain in memory for as long as its persistent_id is in use - therefore
         it should be used in cases when memory is not an issue and correctness of
-        unique identification is preferred.
+        unique identification is preferred. For large streams of objects consider
+        using :py:class:`WeakMemo` instead.
         
         An example use case could be having a cache (memo) of objects already
         processed, where the incoming objects are managed (created etc.) by a user,
@@ -140,24 +148,84 @@ class persistent_id(int):
         self._ref = obj
 
 
-def pad_with_none(*args, minlen=None):
-    if minlen is None or len(args) >= minlen:
-        return args
-    return (*args, *([None] * (minlen - len(args))))
+class WeakMemo(MutableMapping):
+    ''' A memo (dict) keyed by object identity which, unlike a dict keyed by :py:class:`persistent_id`,
+        does not keep its keys alive. Entries are removed automatically when their key object is deallocated,
+        so an id reused by a later object is never mistaken for the old one. This makes it a better choice
+        than :py:class:`persistent_id` when a large stream of objects is processed.
 
+        Objects which do not support weak references (e.g. ``int``, ``list`` or ``dict`` instances) are
+        kept alive for as long as they are in the memo, like with :py:class:`persistent_id`.
+    '''
+    def __init__(self, other=None):
+        self._by_id = {}
+        if other is not None:
+            self.update(other)
+
+    def _reap(self, key, ref):
+        entry = self._by_id.get(key)
+        if entry is not None and entry[0] is ref:
+            del self._by_id[key]
+
+    def __getitem__(self, obj):
+        entry = self._by_id.get(id(obj))
+        if entry is None or entry[0]() is not obj:
+            raise KeyError(obj)
+        return entry[1]
+
+    def __setitem__(self, obj, value):
+        key = id(obj)
+        try:
+            ref = weakref.ref(obj, functools.partial(self._reap, key))
+        except TypeError:
+            ref = functools.partial(_identity, obj)
+        self._by_id[key] = (ref, value)
 
-def import_name(symbol_name):
-    if not symbol_name or symbol_name.endswith('.'):
-        raise ValueError(f'Invalid target name: {symbol_name}')
+    def __delitem__(self, obj):
+        entry = self._by_id.get(id(obj))
+        if entry is None or entry[0]() is not obj:
+            raise KeyError(obj)
+        del self._by_id[id(obj)]
+
+    def __contains__(self, obj):
+        entry = self._by_id.get(id(obj))
+        return entry is not None and entry[0]() is obj
+
+    def __iter__(self):
+        for ref, _ in list(self._by_id.values()):
+            obj = ref()
+            if obj is not None or not isinstance(ref, weakref.ref):
+                yield obj
+
+    def __len__(self):
+        return len(self._by_id)
+
+
+def _identity(obj):
+    return obj
 
-    elements = symbol_name.split('.')
-    current = None
-    try_import = True
-    exceptions = []
 
-    def _build_import_exception(symbol, last, excs):
+def pad_with_none(*args, minlen=None):
+    n = len(args)
+    if minlen is None or n >= minlen:
+        return args
+    return args + (None, ) * (minlen - n)
+
+
+class _ImportNameError(ImportError):
+    ''' Raised by :py:func:`import_name`. The message, which includes formatted
+        tracebacks of all underlying errors, is only built when requested.
+    '''
+    def __init__(self, symbol, last, excs):
+        super().__init__(symbol, name=symbol)
+        self.symbol = symbol
+        self.last = last
+        self.excs = excs
+        self._msg = None
+
+    def _build_msg(self):
         flat_excs = []
-        for e in excs:
+        for e in self.excs:
             this_ex_chain = []
             while e is not None:
                 this_ex_chain.insert(0, e)
@@ -172,19 +240,66 @@ def import_name(symbol_name):
             ex = e
 
         if ex is not None:
-            import traceback
             ex = ''.join(traceback.format_exception(type(ex), ex, ex.__traceback__))
         else:
             ex = '<No information>'
 
-        return ImportError(f'Cannot find an entity named: {symbol!r}, last found element was: {last}, see exception(s) below for potential reasons what could have gone wrong:\n\n{ex}')
+        return f'Cannot find an entity named: {self.symbol!r}, last found element was: {self.last}, see exception(s) below for potential reasons what could have gone wrong:\n\n{ex}'
+
+    def __str__(self):
+        if self._msg is None:
+            self._msg = self._build_msg()
+        return self._msg
+
+    def __reduce__(self):
+        return ImportError, (str(self), )
+
+
+_import_name_cache = {}
+
+
+def import_name(symbol_name):
+    # modules which have already been imported can be returned directly
+    module = sys.modules.get(symbol_name)
+    if module is not None:
+        return module
+
+    # successful lookups are cached as the imported module and the names of the remaining attributes,
+    # attributes are always looked up again so the result follows any changes made to the module
+    cached = _import_name_cache.get(symbol_name)
+    if cached is not None:
+        current, attrs = cached
+        try:
+            for attr in attrs:
+                current = getattr(current, attr)
+            return current
+        except AttributeError:
+            del _import_name_cache[symbol_name]
+
+    if not symbol_name or symbol_name.endswith('.'):
+        raise ValueError(f'Invalid target name: {symbol_name}')
+
+    elements = symbol_name.split('.')
+    if len(elements) == 1 and symbol_name not in sys.modules:
+        # avoid a failed import for builtins like "int" or "len"
+        current = getattr(builtins, symbol_name, None)
+        if current is not None:
+            _import_name_cache[symbol_name] = (builtins, (symbol_name, ))
+            return current
+
+    current = None
+    module = None
+    imported = 0
+    try_import = True
+    exceptions = []
 
     for element in elements:
         if try_import:
-            import importlib
             if current:
                 try:
                     current = importlib.import_module('.' + element, package=current.__name__)
+                    module = current
+                    imported += 1
                     continue
                 except ImportError as e:
                     exceptions.append(e)
@@ -192,6 +307,8 @@ def import_name(symbol_name):
             else:
                 try:
                     current = importlib.import_module(element)
+                    module = current
+                    imported += 1
                     continue
                 except ImportError as e:
                     exceptions.append(e)
@@ -206,16 +323,17 @@ def import_name(symbol_name):
                 pass
 
         if current is None and len(elements) == 1:
-            import builtins
             try:
                 current = getattr(builtins, element)
+                module = builtins
                 continue
             except AttributeError as e:
                 exceptions.append(e)
                 pass
 
-        raise _build_import_exception(symbol_name, current, exceptions)
+        raise _ImportNameError(symbol_name, current, exceptions)
 
+    _import_name_cache[symbol_name] = (module, tuple(elements[imported:]))
     return current
 
 
@@ -226,13 +344,14 @@ class Bunch(dict):
         super().__init__(other)
 
     def __getattr__(self, name):
-        if name not in self:
-            raise AttributeError(f'Object {type(self).__name__!r} does not have attribute {name!r}')
-        return self[name]
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(f'Object {type(self).__name__!r} does not have attribute {name!r}') from None
 
     def __setattr__(self, name, value):
-        if name.startswith('_'):
-            return super().__setattr__(name, value)
+        if name[:1] == '_':
+            return object.__setattr__(self, name, value)
 
         if name in self.__dict__:
             raise ValueError('Name conflict!')
@@ -251,7 +370,13 @@ class LazyModule():
         self.module = module
 
     def __getattr__(self, name):
-        return getattr(self.module, name)
+        # only called when normal lookup fails, store the value so next time it is found directly
+        value = getattr(self.module, name)
+        object.__setattr__(self, name, value)
+        return value
+
+
+_lazy_types = {}
 
 
 def add_module_properties(module_name, properties):
@@ -260,7 +385,11 @@ def add_module_properties(module_name, properties):
     if isinstance(module, LazyModule):
         lazy_type = type(module)
     else:
-        lazy_type = type('LazyModule({})'.format(module_name), (LazyModule,), {})
+        # reuse the type if the module has been wrapped before (e.g. it was re-imported since)
+        lazy_type = _lazy_types.get(module_name)
+        if lazy_type is None:
+            lazy_type = type('LazyModule({})'.format(module_name), (LazyModule,), {})
+            _lazy_types[module_name] = lazy_type
         replace = True
 
     for name, prop in properties.items():
@@ -270,12 +399,17 @@ def add_module_properties(module_name, properties):
         sys.modules[module_name] = lazy_type(module)
 
 
+_python_version = sys.version_info[:2]
+
+
+@functools.lru_cache(maxsize=None)
 def python_is_at_least(major, minor):
-    return sys.version_info[0] > major or (sys.version_info[0] == major and sys.version_info[1] >= minor)
+    return _python_version >= (major, minor)
 
 
+@functools.lru_cache(maxsize=None)
 def python_is_exactly(major, minor):
-    return sys.version_info[0] == major and sys.version_info[1] == minor
+    return _python_version == (major, minor)
 
 
 def notnone_or(value, alt):
@@ -12,56 +12,84 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
+
 version = '1.1.4'
-repo = 'unknown'
-commit = 'unknown'
-has_repo = False
 
-try:
-    import git
+def _probe_git():
+    ''' Returns a dict with ``repo``, ``commit`` and ``has_repo`` describing the git repository
+        containing the package. Walking the repo can take a while so it is only done
+        when one of these values is accessed.
+    '''
+    ret = { 'repo': 'unknown', 'commit': 'unknown', 'has_repo': False }
+    try:
+        import git
+    except ImportError:
+        return ret
+
     from pathlib import Path
 
     try:
         r = git.Repo(Path(__file__).parents[1])
-        has_repo = True
-
-        if not r.remotes:
-            repo = 'local'
-        else:
-            repo = r.remotes.origin.url
-
-        commit = r.head.commit.hexsha
-        status = []
-        if r.is_dirty():
-            status.append('dirty')
-        if r.untracked_files:
-            status.append(f'+{len(r.untracked_files)} untracked')
-        if status:
-            commit += f' ({",".join(status)})'
     except git.InvalidGitRepositoryError:
-        raise ImportError()
-except ImportError:
-    pass
+        return ret
+
+    ret['has_repo'] = True
+    if not r.remotes:
+        ret['repo'] = 'local'
+    else:
+        ret['repo'] = r.remotes.origin.url
+
+    commit = r.head.commit.hexsha
+    status = []
+    if r.is_dirty(untracked_files=False):
+        status.append('dirty')
+    untracked = r.untracked_files
+    if untracked:
+        status.append(f'+{len(untracked)} untracked')
+    if status:
+        commit += f' ({",".join(status)})'
+
+    ret['commit'] = commit
+    return ret
+
+
+def __getattr__(name):
+    if name in ('repo', 'commit', 'has_repo'):
+        g = globals()
+        g.update(_probe_git())
+        return g[name]
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+if sys.version_info < (3, 7):
+    # module-level __getattr__ is not supported
+    globals().update(_probe_git())
 
 try:
-    import importlib
-    from pathlib import Path
-    _dist_info_file = Path(__file__).parent.joinpath('_dist_info.py')
-    if _dist_info_file.exists():
-        _spec = importlib.util.spec_from_file_location('_dist_info', _dist_info_file)
-        _dist_info = importlib.util.module_from_spec(_spec)
-        _spec.loader.exec_module(_dist_info)
-        assert not has_repo, '_dist_info should not exist when repo is in place'
-        assert version == _dist_info.version
-        repo = _dist_info.repo
-        commit = _dist_info.commit
+    from . import _dist_info
 except (ImportError, SystemError):
-    pass
+    _dist_info = None
+
+if _dist_info is not None:
+    assert version == _dist_info.version
+    repo = _dist_info.repo
+    commit = _dist_info.commit
+    has_repo = False
+
+
+_info = None
 
 
 def info():
-    g = globals()
-    return { k: g[k] for k in __all__ }
+    global _info
+    if _info is None:
+        g = globals()
+        if 'has_repo' not in g:
+            g.update(_probe_git())
+        _info = { k: g[k] for k in __all__ }
+    return _info.copy()
 
 
 __all__ = ['version', 'repo', 'commit', 'has_repo']
@@ -12,26 +12,48 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import sys
 import yaml
 import re
-import copy
-import token
+import base64
 import pickle
-import tokenize
+import importlib
 import functools
 import contextlib
+import collections
 import collections.abc as cabc
 
 from .nodes.node import ConfigNode
 from .nodes.composed import ComposedNode
-from .utils import pad_with_none
+from .nodes.scalar import ConfigScalar
+from .nodes.append import AppendNode
+from .nodes.bind import BindNode
+from .nodes.call import CallNode
+from .nodes.clear import ClearNode
+from .nodes.eval import EvalNode
+from .nodes.extend import ExtendNode
+from .nodes.fstr import FStrNode
+from .nodes.include import IncludeNode
+from .nodes.path import PathNode
+from .nodes.prev import PrevNode
+from .nodes.recurse import RecurseNode
+from .nodes.required import RequiredNode
+from .nodes.xref import XRefNode
 from . import errors
 
+ImportNode = importlib.import_module('.nodes.import', package=__package__).ImportNode # dirty hack because "import" is a keyword
+
 
 _fstr_regex = re.compile(r"^\s*f(['\"]).*\1\s*$")
+_metadata_tag_regex = re.compile(r'(![a-zA-Z0-9_:.()]+){{')
+_metadata_scan_regex = re.compile(r'[{}\'"#]')
+_string_scan_regexes = { q: re.compile(r'\\.|' + re.escape(q), re.DOTALL) for q in ["'", '"', "'''", '"""'] }
 
 _global_ctx = None
 
+use_libyaml = yaml.__with_libyaml__ # whether yaml should be parsed with libyaml (if available), the pure-python parser is much slower but includes code snippets in error messages
+
 
 class UnquotedNode(yaml.ScalarNode):
     pass
@@ -41,11 +63,15 @@ class AwesomeyamlLoader(yaml.Loader):
     def _convert(self, value, node):
         if value is None and node.value == '':
             return value
+        if getattr(value, '_is_config_node', False) is not True:
+            return ConfigNode._fast_new(value, pyyaml_node=node, idx=self.context.get_next_stage_idx(), source_file=self.current_file)
+
+        # existing nodes only inherit some of the arguments, see _inherit_kwargs
         ret = ConfigNode(value, pyyaml_node=node)
         if ret._idx is None:
             ret._idx = self.context.get_next_stage_idx()
         if ret._source_file is None:
-            ret._source_file = self.context.get_current_file()
+            ret._source_file = self.current_file
         return ret
 
     @staticmethod
@@ -69,6 +95,18 @@ class AwesomeyamlLoader(yaml.Loader):
         return aynode
 
 
+if yaml.__with_libyaml__:
+    class AwesomeyamlCLoader(yaml.cyaml.CParser, AwesomeyamlLoader):
+        ''' The same as `AwesomeyamlLoader` but uses libyaml to parse yaml documents.
+        '''
+        def __init__(self, stream):
+            yaml.cyaml.CParser.__init__(self, stream)
+            yaml.constructor.Constructor.__init__(self)
+            yaml.resolver.Resolver.__init__(self)
+else:
+    AwesomeyamlCLoader = None
+
+
 class AwesomeyamlDumper(yaml.Dumper):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -125,8 +163,8 @@ def add_multi_constructor(tag, constructor):
     yaml.add_multi_constructor(tag, constructor, Loader=AwesomeyamlLoader)
 
 
-def add_implicit_resolver(tag, regex):
-    yaml.add_implicit_resolver(tag, regex, Loader=AwesomeyamlLoader, Dumper=AwesomeyamlDumper)
+def add_implicit_resolver(tag, regex, first=None):
+    yaml.add_implicit_resolver(tag, regex, first=first, Loader=AwesomeyamlLoader, Dumper=AwesomeyamlDumper)
 
 
 def add_representer(data_type, representer):
@@ -161,27 +199,52 @@ def global_ctx(filename):
 
 
 def _encode_metadata(metadata):
-    return pickle.dumps(metadata).hex()
+    return base64.urlsafe_b64encode(pickle.dumps(metadata)).decode('ascii').rstrip('=')
 
 
-def _decode_metadata(encoded):
-    if not encoded:
-        return {}
-    metadata = pickle.loads(bytes.fromhex(encoded))
-    kwargs = {}
-    for special in ConfigNode.special_metadata_names:
-        if special in metadata:
-            kwargs[special] = metadata.pop(special)
+_special_metadata_names = tuple(ConfigNode.special_metadata_names)
 
+
+def _decode_metadata_uncached(encoded):
+    # pickles always start with 0x80, which is 'g' in base64 but '80' in hex (used by older versions)
+    if encoded[0] == 'g':
+        data = base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4))
+    else:
+        data = bytes.fromhex(encoded)
+    metadata = pickle.loads(data)
+    kwargs = { name: metadata.pop(name) for name in _special_metadata_names if name in metadata }
     kwargs['metadata'] = metadata
     return kwargs
 
 
+_immutable_metadata_types = (str, int, float, bool, type(None))
+
+
+@functools.lru_cache(maxsize=1024)
+def _decode_metadata_cached(encoded):
+    kwargs = _decode_metadata_uncached(encoded)
+    # results are shared between calls, this is only safe if nothing inside can be modified in-place
+    if not all(type(v) in _immutable_metadata_types for v in kwargs['metadata'].values()):
+        return None
+    return kwargs
+
+
+def _decode_metadata(encoded):
+    if not encoded:
+        return {}
+    # the same payloads tend to repeat across a config, interning makes cache hits an identity check
+    kwargs = _decode_metadata_cached(sys.intern(encoded))
+    if kwargs is None:
+        return _decode_metadata_uncached(encoded)
+    return { **kwargs, 'metadata': kwargs['metadata'].copy() }
+
+
 def parse_scalar(loader, node):
-    plain = (node.style is None)
+    plain = not node.style # None for the pure-python parser, '' for libyaml
     implicit = (True, False) if plain else (False, True)
-    notag = copy.deepcopy(node)
-    notag.tag = loader.resolve(yaml.ScalarNode, notag.value, implicit)
+    # a new node is needed since the loader is currently constructing ``node`` and would treat it as recursive
+    tag = loader.resolve(yaml.ScalarNode, node.value, implicit)
+    notag = yaml.ScalarNode(tag, node.value, node.start_mark, node.end_mark, node.style)
     ret = loader.construct_object(notag, deep=True, convert=False)
     if ret is None and node.value != '':
         # we differentiate between explicit and implicit None
@@ -239,7 +302,7 @@ def _make_node(loader, node, node_type=ConfigNode, kwargs=None, data_arg_name=No
         else:
             data = parse_scalar(loader, node)
 
-    kwargs.setdefault('source_file', loader.context.get_current_file())
+    kwargs.setdefault('source_file', loader.current_file)
 
     if is_dict and not dict_is_data:
         kwargs.update(data)
@@ -256,29 +319,27 @@ def _make_node(loader, node, node_type=ConfigNode, kwargs=None, data_arg_name=No
 make_node = rethrow_as_parsing_error(_make_node)
 
 
-@rethrow_as_parsing_error
-def _del_constructor(loader, node):
-    return _make_node(loader, node, kwargs={ 'delete': True })
-
-
-@rethrow_as_parsing_error
-def _weak_constructor(loader, node):
-    return _make_node(loader, node, kwargs={ 'priority': ConfigNode.WEAK })
-
-
-@rethrow_as_parsing_error
-def _force_constructor(loader, node):
-    return _make_node(loader, node, kwargs={ 'priority': ConfigNode.FORCE })
+def _make_flags_constructor(flags):
+    @rethrow_as_parsing_error
+    def _constructor(loader, node):
+        return _make_node(loader, node, kwargs=dict(flags)) # _make_node modifies kwargs
+    return _constructor
 
 
-@rethrow_as_parsing_error
-def _merge_constructor(loader, node):
-    return _make_node(loader, node, kwargs={ 'delete': False })
+# tags which only set a flag for the tagged node
+_flag_tags = {
+    '!del': { 'delete': True },
+    '!merge': { 'delete': False },
+    '!weak': { 'priority': ConfigNode.WEAK },
+    '!force': { 'priority': ConfigNode.FORCE },
+    '!new': { 'allow_new': True },
+    '!notnew': { 'allow_new': False },
+    '!unsafe': { 'safe': False }
+}
 
 
 @rethrow_as_parsing_error
 def _append_constructor(loader, node):
-    from .nodes.append import AppendNode
     return _make_node(loader, node, node_type=AppendNode)
 
 
@@ -290,203 +351,165 @@ def _metadata_constructor(loader, tag_suffix, node):
 
 @rethrow_as_parsing_error
 def _include_constructor(loader, node):
-    from .nodes.include import IncludeNode
     return _make_node(loader, node, node_type=IncludeNode, dict_is_data=False, parse_scalars=False)
 
 
 @rethrow_as_parsing_error
 def _prev_constructor(loader, node):
-    from .nodes.prev import PrevNode
     return _make_node(loader, node, node_type=PrevNode, parse_scalars=False)
 
 
 @rethrow_as_parsing_error
 def _xref_constructor(loader, node):
-    from .nodes.xref import XRefNode
     return _make_node(loader, node, node_type=XRefNode, parse_scalars=False)
 
 @rethrow_as_parsing_error
 def _xref_constructor_md(loader, tag_suffix, node):
-    from .nodes.xref import XRefNode
     kwargs = _decode_metadata(tag_suffix)
     return _make_node(loader, node, kwargs=kwargs, node_type=XRefNode, parse_scalars=False)
 
 
 @rethrow_as_parsing_error
 def _simple_bind_constructor(loader, node):
-    from .nodes.bind import BindNode
     return _make_node(loader, node, node_type=BindNode, data_arg_name='func')
 
 
 @rethrow_as_parsing_error
 def _bind_constructor(loader, tag_suffix, node):
-    from .nodes.bind import BindNode
     if tag_suffix.count(':') > 1:
         raise ValueError(f'Invalid bind tag: !bind:{tag_suffix}')
 
-    target_f_name, metadata = pad_with_none(*tag_suffix.split(':', maxsplit=1), minlen=2)
+    target_f_name, _, metadata = tag_suffix.partition(':')
     kwargs = _decode_metadata(metadata)
     return _make_node(loader, node, node_type=BindNode, kwargs={ 'func': target_f_name, **kwargs }, data_arg_name='args')
 
 
 @rethrow_as_parsing_error
 def _simple_call_constructor(loader, node):
-    from .nodes.call import CallNode
     return _make_node(loader, node, node_type=CallNode, data_arg_name='func')
 
 
 @rethrow_as_parsing_error
 def _call_constructor(loader, tag_suffix, node):
-    from .nodes.call import CallNode
     if tag_suffix.count(':') > 1:
         raise ValueError(f'Invalid call tag: !call:{tag_suffix}')
 
-    target_f_name, metadata = pad_with_none(*tag_suffix.split(':', maxsplit=1), minlen=2)
+    target_f_name, _, metadata = tag_suffix.partition(':')
     kwargs = _decode_metadata(metadata)
     return _make_node(loader, node, node_type=CallNode, kwargs={ 'func': target_f_name, **kwargs }, data_arg_name='args')
 
 
 @rethrow_as_parsing_error
 def _eval_constructor(loader, tag_suffix, node):
-    from .nodes.eval import EvalNode
     kwargs = _decode_metadata(tag_suffix)
     return _make_node(loader, node, node_type=EvalNode, kwargs=kwargs, parse_scalars=False)
 
 
 @rethrow_as_parsing_error
 def _simple_eval_constructor(loader, node):
-    from .nodes.eval import EvalNode
     return _make_node(loader, node, node_type=EvalNode, parse_scalars=False)
 
 
 @rethrow_as_parsing_error
 def _fstr_constructor(loader, node):
-    from .nodes.fstr import FStrNode
 
     def _maybe_fix_fstr(value, *args, **kwargs):
-        try:
-            return FStrNode(value, *args, **kwargs)
-        except ValueError:
-            return FStrNode("f'" + value.replace(r"'", r"\'") + "'", *args, **kwargs)
+        # only try the value as-is if it looks like an f-string, raising and catching is comparatively slow
+        if value[:2] in ("f'", 'f"') and value[-1] == value[1]:
+            try:
+                return FStrNode(value, *args, **kwargs)
+            except ValueError:
+                pass
+        return FStrNode("f'" + value.replace("'", "\\'") + "'", *args, **kwargs)
 
     return _make_node(loader, node, node_type=_maybe_fix_fstr, parse_scalars=False)
 
 
 @rethrow_as_parsing_error
 def _import_constructor(loader, node):
-    import importlib
-    module = importlib.import_module('.nodes.import', package='awesomeyaml') # dirty hack because "import" is a keyword
-    ImportNode = module.ImportNode
     return _make_node(loader, node, node_type=ImportNode, parse_scalars=False)
 
 
 @rethrow_as_parsing_error
 def _required_constructor(loader, node):
-    from .nodes.required import RequiredNode
     return _make_node(loader, node, node_type=RequiredNode)
 
 
 @rethrow_as_parsing_error
 def _required_constructor_md(loader, tag_suffix, node):
-    from .nodes.required import RequiredNode
     kwargs = _decode_metadata(tag_suffix)
     return _make_node(loader, node, kwargs=kwargs, node_type=RequiredNode)
 
 
 @rethrow_as_parsing_error
 def _none_constructor(loader, node):
-    from .nodes.scalar import ConfigScalar
     return _make_node(loader, node, node_type=ConfigScalar(type(None)))
 
 
 @rethrow_as_parsing_error
 def _none_constructor_md(loader, tag_suffix, node):
-    from .nodes.scalar import ConfigScalar
     kwargs = _decode_metadata(tag_suffix)
     return _make_node(loader, node, kwargs=kwargs, node_type=ConfigScalar(type(None)))
 
 
 @rethrow_as_parsing_error
 def _simple_path_constructor(loader, node):
-    from .nodes.path import PathNode
     return _make_node(loader, node, node_type=PathNode, kwargs={ 'ref_point': None })
 
 
 @rethrow_as_parsing_error
 def _path_constructor(loader, tag_suffix, node):
-    from .nodes.path import PathNode
     if tag_suffix.count(':') > 1:
         raise ValueError(f'Invalid path tag: !path:{tag_suffix}')
 
-    ref_point, metadata = pad_with_none(*tag_suffix.rsplit(':', maxsplit=1), minlen=2)
+    ref_point, sep, metadata = tag_suffix.rpartition(':')
+    if not sep:
+        ref_point, metadata = metadata, None
     kwargs = _decode_metadata(metadata)
     return _make_node(loader, node, node_type=PathNode, kwargs={ 'ref_point': ref_point, **kwargs }, dict_is_data=False)
 
 
-@rethrow_as_parsing_error
-def _new_constructor(loader, node):
-    return _make_node(loader, node, kwargs={ 'allow_new': True })
-
-
-@rethrow_as_parsing_error
-def _notnew_constructor(loader, node):
-    return _make_node(loader, node, kwargs={ 'allow_new': False })
-
-
-@rethrow_as_parsing_error
-def _unsafe_constructor(loader, node):
-    return _make_node(loader, node, kwargs={ 'safe': False })
-
-
 @rethrow_as_parsing_error
 def make_call_node_with_fixed_func(loader, node, func):
-    from .nodes.call import CallNode
     return _make_node(loader, node, node_type=CallNode, kwargs={ 'func': func }, data_arg_name='args')
 
 
 @rethrow_as_parsing_error
 def _clear_constructor(loader, node):
-    from .nodes.clear import ClearNode
     return _make_node(loader, node, node_type=ClearNode)
 
 
 @rethrow_as_parsing_error
 def _clear_constructor_md(loader, tag_suffix, node):
-    from .nodes.clear import ClearNode
     kwargs = _decode_metadata(tag_suffix)
     return _make_node(loader, node, kwargs=kwargs, node_type=ClearNode)
 
 
 @rethrow_as_parsing_error
 def _extend_constructor(loader, node):
-    from .nodes.extend import ExtendNode
     return _make_node(loader, node, node_type=ExtendNode)
 
 
 @rethrow_as_parsing_error
 def _extend_constructor_md(loader, tag_suffix, node):
-    from .nodes.extend import ExtendNode
     kwargs = _decode_metadata(tag_suffix)
     return _make_node(loader, node, kwargs=kwargs, node_type=ExtendNode)
 
 
 @rethrow_as_parsing_error
 def _rec_constructor(loader, node):
-    from .nodes.recurse import RecurseNode
     return _make_node(loader, node, node_type=RecurseNode, dict_is_data=False, parse_scalars=False)
 
 
 @rethrow_as_parsing_error
 def _rec_constructor_md(loader, tag_suffix, node):
-    from .nodes.recurse import RecurseNode
     kwargs = _decode_metadata(tag_suffix)
     return _make_node(loader, node, kwargs=kwargs, node_type=RecurseNode, dict_is_data=False, parse_scalars=False)
 
 
-add_constructor('!del', _del_constructor)
-add_constructor('!weak', _weak_constructor)
-add_constructor('!force', _force_constructor)
-add_constructor('!merge', _merge_constructor)
+for _tag, _flags in _flag_tags.items():
+    add_constructor(_tag, _make_flags_constructor(_flags))
+
 add_constructor('!append', _append_constructor)
 add_multi_constructor('!metadata:', _metadata_constructor)
 add_constructor('!include', _include_constructor)
@@ -502,7 +525,7 @@ add_constructor('!call', _simple_call_constructor) # simple argumentless call fr
 add_multi_constructor('!eval:', _eval_constructor)
 add_constructor('!eval', _simple_eval_constructor)
 add_constructor('!fstr', _fstr_constructor)
-add_implicit_resolver('!fstr', _fstr_regex)
+add_implicit_resolver('!fstr', _fstr_regex, first='f') # implicit tags are only resolved for plain scalars, which never start with whitespace
 add_constructor('!import', _import_constructor)
 add_constructor('!required', _required_constructor)
 add_multi_constructor('!required:', _required_constructor_md)
@@ -510,9 +533,6 @@ add_constructor('!null', _none_constructor)
 add_multi_constructor('!null:', _none_constructor_md)
 add_multi_constructor('!path:', _path_constructor)
 add_constructor('!path', _simple_path_constructor)
-add_constructor('!new', _new_constructor)
-add_constructor('!notnew', _notnew_constructor)
-add_constructor('!unsafe', _unsafe_constructor)
 add_constructor('!clear', _clear_constructor)
 add_multi_constructor('!clear:', _clear_constructor_md)
 add_constructor('!extend', _extend_constructor)
@@ -521,8 +541,29 @@ add_constructor('!rec', _rec_constructor)
 add_constructor('!rec:', _rec_constructor_md)
 
 
+# simple tags which can be used instead of encoded metadata, when dumping nodes
+_tags_to_infer = {
+    'priority': {
+        ConfigNode.STANDARD: '',
+        ConfigNode.WEAK: '!weak',
+        ConfigNode.FORCE: '!force'
+    },
+    'delete': {
+        True: '!del',
+        False: '!merge'
+    },
+    'allow_new': {
+        True: '!new',
+        False: '!notnew'
+    },
+    'safe': {
+        True: '!safe',
+        False: '!unsafe'
+    }
+}
+
+
 def _node_representer(dumper, node):
-    from .nodes.bind import BindNode
     tag, metadata, data = node.ayns.represent()
     if data is None:
         assert not tag
@@ -531,29 +572,7 @@ def _node_representer(dumper, node):
     parent_metadata = dumper.metadata[-1] if dumper.metadata else {}
     type_defaults = node.ayns.get_default_mode()
 
-    tags_to_infer = {
-        'priority': {
-            ConfigNode.STANDARD: '',
-            ConfigNode.WEAK: '!weak',
-            ConfigNode.FORCE: '!force'
-        },
-        'delete': {
-            True: '!del',
-            False: '!merge'
-        },
-        'allow_new': {
-            True: '!new',
-            False: '!notnew'
-        },
-        'safe': {
-            True: '!safe',
-            False: '!unsafe'
-        }
-    }
-
-    to_infer = list(tags_to_infer.keys())
-
-    for f in to_infer:
+    for f in _tags_to_infer:
         if f not in metadata:
             continue
 
@@ -566,7 +585,8 @@ def _node_representer(dumper, node):
         else:
             del metadata[f]
 
-    metadata = { key: value for key, value in metadata.items() if key not in dumper.exclude_metadata }
+    if dumper.exclude_metadata:
+        metadata = { key: value for key, value in metadata.items() if key not in dumper.exclude_metadata }
 
     # try to use simple standard tag rather then encoded metadata
     # this is possible if we only have one special thing to handle
@@ -577,9 +597,9 @@ def _node_representer(dumper, node):
     if not tag and len(metadata) == 1:
         # check if the only element in metadata is one of the standard
         # things which can be controller with simple tags (those listed
-        # in "tags_to_infer")
+        # in "_tags_to_infer")
         key = next(iter(metadata.keys()))
-        maybe_tag = tags_to_infer.get(key)
+        maybe_tag = _tags_to_infer.get(key)
         if maybe_tag:
             tag = maybe_tag[metadata[key]]
             del metadata[key]
@@ -592,7 +612,8 @@ def _node_representer(dumper, node):
 
     pop = False
     if isinstance(node, ComposedNode):
-        dumper.metadata.append({ **parent_metadata, **metadata })
+        # metadata is not modified past this point so it can be chained instead of merged
+        dumper.metadata.append(collections.ChainMap(metadata, parent_metadata) if metadata else parent_metadata)
         pop = True
 
     try:
@@ -616,7 +637,6 @@ def _node_representer(dumper, node):
                     data = tuple(data)
                 return dumper.represent_data(data)
         else:
-            from .nodes.scalar import ConfigScalar
             if tag:
                 if data is None:
                     assert tag.startswith('!null')
@@ -646,38 +666,55 @@ add_multi_representer(ConfigNode, _node_representer)
 add_representer(type(None), _none_representer)
 
 
+def _skip_string(data, pos):
+    ''' Returns position right after a python string literal starting at ``pos``, or ``None``
+        if the string is not terminated.
+    '''
+    quote = data[pos] * 3
+    if not data.startswith(quote, pos):
+        quote = data[pos]
+    pos += len(quote)
+    while True:
+        match = _string_scan_regexes[quote].search(data, pos)
+        if match is None:
+            return None
+        pos = match.end()
+        if match.group() == quote:
+            return pos
+
+
 def _get_metadata_end(data, beg):
-    _beg = beg+2
-    def _readline():
-        nonlocal _beg
-        end = data.find('}}', _beg)
-        if end == -1:
-            end = len(data)
-        else:
-            end += 2
-
-        ret = data[_beg:end]
-        _beg = end
-        return ret.encode('utf8')
-         
-    last_close = False
-    end = None
-    for tok in tokenize.tokenize(_readline):
-        if tok.type == token.OP and tok.string == '}':
-            if last_close:
-                end = _beg
-                break
-            else:
-                last_close = True
+    ''' Returns position right after the ``}}`` closing a metadata block which opens
+        with ``{{`` at ``beg``, or ``None`` if it cannot be found.
+        Braces within string literals and comments are ignored.
+    '''
+    depth = 0
+    pos = beg
+    while pos is not None:
+        match = _metadata_scan_regex.search(data, pos)
+        if match is None:
+            return None
+
+        c = match.group()
+        pos = match.end()
+        if c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if not depth:
+                return pos
+        elif c == '#':
+            pos = data.find('\n', pos)
+            if pos == -1:
+                return None
         else:
-            last_close = False
+            pos = _skip_string(data, pos - 1)
 
-    return end
+    return None
 
 
 def _get_metadata_content(data):
-    _metadata_tag = re.compile(r'(![a-zA-Z0-9_:.()]+){{')
-    curr_match = _metadata_tag.search(data)
+    curr_match = _metadata_tag_regex.search(data)
     while curr_match is not None:
         beg = curr_match.end(1)
         assert data[beg:beg+2] == '{{'
@@ -686,31 +723,63 @@ def _get_metadata_content(data):
             raise ValueError(f'Cannot find the end of a !metadata node which begins at: {curr_match.start()}')
 
         yield beg, end
-        curr_match = _metadata_tag.search(data, end+1)
+        curr_match = _metadata_tag_regex.search(data, end+1)
 
 
 def _encode_all_metadata(data):
-    ranges = list(_get_metadata_content(data))
-    offset = 0
-    for beg, end in ranges:
-        beg += offset
-        end += offset
+    if '{{' not in data:
+        return data
 
+    parts = []
+    last = 0
+    for beg, end in _get_metadata_content(data):
         metadata = eval(data[beg+1:end-1])
-        encoded = _encode_metadata(metadata)
-        repl = ':' + encoded
-        orig_len = end-beg
-        repl_len = len(repl)
-        data = data[:beg] + repl + data[end:]
-        offset += repl_len - orig_len
+        parts.append(data[last:beg])
+        parts.append(':' + _encode_metadata(metadata))
+        last = end
+
+    parts.append(data[last:])
+    return ''.join(parts)
+
+
+_scan_chunk_size = 1 << 16
+
+
+def _stream_has_metadata(stream):
+    ''' Checks if a seekable stream contains ``{{`` without reading it whole,
+        the stream is rewound to its original position afterwards.
+    '''
+    start = stream.tell()
+    try:
+        last = ''
+        while True:
+            chunk = stream.read(_scan_chunk_size)
+            if not chunk:
+                return False
+            if '{{' in chunk or (last == '{' and chunk[0] == '{'):
+                return True
+            last = chunk[-1]
+    finally:
+        stream.seek(start)
 
-    return data
+
+class _NamedStream():
+    ''' Exposes ``stream.read`` under a different ``name``, libyaml takes the name used in error marks from the stream. '''
+    def __init__(self, stream, name):
+        self.read = stream.read
+        self.name = name
 
 
 @errors.api_entry
 def parse(data, filename_or_builder=None, config_nodes=True):
+    stream = None
     if not isinstance(data, str):
-        data = data.read()
+        # streams without metadata can be passed to pyyaml directly, otherwise they have to be encoded as a whole
+        seekable = getattr(data, 'seekable', None)
+        if seekable is not None and seekable() and not _stream_has_metadata(data):
+            stream = data
+        else:
+            data = data.read()
 
     @contextlib.contextmanager
     def _dummy(context):
@@ -729,11 +798,24 @@ def parse(data, filename_or_builder=None, config_nodes=True):
 
     #print(data)
     with context_fn(filename_or_builder) as context:
-        data = _encode_all_metadata(data)
+        if stream is None:
+            data = _encode_all_metadata(data)
+        loader_type = AwesomeyamlLoader
+        if use_libyaml and AwesomeyamlCLoader is not None:
+            loader_type = AwesomeyamlCLoader
+            # libyaml takes the name used in error marks from the stream
+            if stream is None:
+                data = io.StringIO(data)
+                data.name = context.get_current_file()
+            else:
+                data = _NamedStream(stream, context.get_current_file())
+
         def get_loader(*args, **kwargs):
-            loader = AwesomeyamlLoader(*args, **kwargs)
+            loader = loader_type(*args, **kwargs)
             loader.context = context
-            loader.name = context.get_current_file()
+            # the file does not change while a stream is being loaded
+            loader.current_file = context.get_current_file()
+            loader.name = loader.current_file
             return loader
 
         try:
@@ -765,7 +847,7 @@ def dump(nodes, output=None, open_mode='w', exclude_metadata=None, sort_keys=Fal
         dumper = AwesomeyamlDumper(*args, **kwargs)
         assert not hasattr(dumper, 'metadata')
         dumper.metadata = []
-        dumper.exclude_metadata = exclude_metadata or set()
+        dumper.exclude_metadata = frozenset(exclude_metadata or ())
         return dumper
 
     try:
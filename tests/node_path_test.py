@@ -0,0 +1,123 @@
+# Copyright 2022 Samsung Electronics Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import pickle
+import unittest
+
+from .utils import setUpModule
+
+
+class NodePathTest(unittest.TestCase):
+    def test_str(self):
+        from awesomeyaml.nodes.node_path import NodePath
+        p = NodePath(['foo', 0, 'bar'])
+        self.assertEqual(str(p), 'foo[0].bar')
+        self.assertEqual(str(p), 'foo[0].bar')
+        self.assertEqual(hash(p), hash('foo[0].bar'))
+
+    def test_str_after_modification(self):
+        from awesomeyaml.nodes.node_path import NodePath
+        p = NodePath(['foo'])
+        self.assertEqual(str(p), 'foo')
+        p.append(1)
+        self.assertEqual(str(p), 'foo[1]')
+        p.extend(['bar', 'baz'])
+        self.assertEqual(str(p), 'foo[1].bar.baz')
+        p[0] = 'x'
+        self.assertEqual(str(p), 'x[1].bar.baz')
+        del p[1]
+        self.assertEqual(str(p), 'x.bar.baz')
+        p.pop()
+        self.assertEqual(str(p), 'x.bar')
+        p += ['y']
+        self.assertEqual(str(p), 'x.bar.y')
+        p.insert(0, 'z')
+        self.assertEqual(str(p), 'z.x.bar.y')
+        p.clear()
+        self.assertEqual(str(p), '')
+
+    def test_copy(self):
+        from awesomeyaml.nodes.node_path import NodePath
+        p = NodePath(['foo', 0])
+        self.assertEqual(str(p), 'foo[0]')
+        for p2 in [copy.copy(p), copy.deepcopy(p), pickle.loads(pickle.dumps(p))]:
+            self.assertEqual(p2, p)
+            self.assertEqual(str(p2), 'foo[0]')
+            p2.append('bar')
+            self.assertEqual(str(p2), 'foo[0].bar')
+            self.assertEqual(str(p), 'foo[0]')
+
+    def test_split(self):
+        from awesomeyaml.nodes.node_path import NodePath
+        self.assertEqual(list(NodePath.split_path('')), [])
+        self.assertEqual(list(NodePath.split_path('foo')), ['foo'])
+        self.assertEqual(list(NodePath.split_path('foo[0].bar[-1][2]')), ['foo', 0, 'bar', -1, 2])
+        self.assertEqual(list(NodePath.split_path('[1].foo')), [1, 'foo'])
+        for invalid in ['.foo', 'foo.', 'foo..bar', 'foo.[0]', 'foo[0]bar', 'foo bar', 'foo[bar]']:
+            with self.assertRaises(ValueError):
+                list(NodePath.split_path(invalid))
+
+    def test_join(self):
+        from awesomeyaml.nodes.node_path import NodePath
+        self.assertEqual(NodePath.join_path([]), '')
+        self.assertEqual(NodePath.join_path(['foo']), 'foo')
+        self.assertEqual(NodePath.join_path([0, 'foo', 'bar', -1, 2]), '[0].foo.bar[-1][2]')
+        # empty components only add a separator once the path is non-empty
+        self.assertEqual(NodePath.join_path(['', 'foo', '', 'bar']), 'foo..bar')
+        self.assertEqual(NodePath.join_path(['a', '', 'b']), 'a..b')
+        self.assertEqual(NodePath.join_path(['a', '']), 'a.')
+        for path in ['foo[0].bar[-1][2]', '[1].foo', 'a.b.c']:
+            self.assertEqual(NodePath.join_path(NodePath.split_path(path)), path)
+
+    def test_child(self):
+        from awesomeyaml.nodes.node_path import NodePath
+        p = NodePath(['foo'])
+        c = p.child(0)
+        self.assertEqual(c, ['foo', 0])
+        self.assertEqual(str(c), 'foo[0]')
+        self.assertEqual(p, ['foo'])
+        self.assertEqual(str(p), 'foo')
+        c = p.child('bar').child(1).child('baz')
+        self.assertEqual(c, ['foo', 'bar', 1, 'baz'])
+        self.assertEqual(str(c), 'foo.bar[1].baz')
+        self.assertEqual(str(NodePath().child('foo')), 'foo')
+        self.assertEqual(str(NodePath().child(2)), '[2]')
+        self.assertEqual(str(NodePath(['foo']).child('')), str(NodePath(['foo', ''])))
+
+    def test_add(self):
+        from awesomeyaml.nodes.node_path import NodePath
+        p = NodePath(['foo'])
+        self.assertEqual(str(p), 'foo')
+        c = p + [0, 'bar']
+        self.assertIsInstance(c, NodePath)
+        self.assertEqual(c, ['foo', 0, 'bar'])
+        self.assertEqual(str(c), 'foo[0].bar')
+        self.assertEqual(str(NodePath() + ['foo', 1]), 'foo[1]')
+        self.assertEqual(str(NodePath(['foo', 1]) + []), 'foo[1]')
+        p += ('bar', 2)
+        self.assertEqual(p, ['foo', 'bar', 2])
+        self.assertEqual(str(p), 'foo.bar[2]')
+        p += (c for c in ['baz'])
+        self.assertEqual(str(p), 'foo.bar[2].baz')
+
+    def test_normalize(self):
+        from awesomeyaml.nodes.node_path import NodePath
+        p = NodePath(['foo', 0])
+        self.assertIs(NodePath.get_list_path(p), p)
+        self.assertEqual(NodePath.get_list_path('foo[0]'), p)
+        self.assertEqual(NodePath.get_list_path(['foo', 0]), p)
+        self.assertEqual(NodePath.get_str_path(p), 'foo[0]')
+        self.assertEqual(NodePath.get_str_path(NodePath()), '')
+        self.assertEqual(NodePath.get_str_path('foo', 0), 'foo[0]')
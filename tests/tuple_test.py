@@ -0,0 +1,84 @@
+# Copyright 2022 Samsung Electronics Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from .utils import setUpModule
+
+
+class TupleNodeTest(unittest.TestCase):
+    def test_construction(self):
+        from awesomeyaml.nodes.tuple import ConfigTuple
+        from awesomeyaml.nodes.list import ConfigList
+
+        test = ConfigTuple((1, [2, 3]))
+        self.assertEqual(test, (1, [2, 3]))
+        self.assertIsInstance(test[1], ConfigList)
+        for i in range(2):
+            self.assertIs(test[i], test.ayns.get_child(i))
+            self.assertIs(test[i], test._children[i])
+
+        self.assertEqual(ConfigTuple(None), ())
+        self.assertEqual(ConfigTuple([]), ())
+        self.assertEqual(test.ayns.children_count(), 2)
+
+    def test_child_kwargs(self):
+        from awesomeyaml.nodes.node import ConfigNode
+
+        test = ConfigNode((1, [2]), source_file='x.yaml')
+        self.assertEqual(test.ayns.source_file, 'x.yaml')
+        self.assertEqual(test[0].ayns.source_file, 'x.yaml')
+        self.assertEqual(test[1].ayns.source_file, 'x.yaml')
+        self.assertEqual(test[1][0].ayns.source_file, 'x.yaml')
+
+        shared = [1]
+        test = ConfigNode((shared, shared))
+        self.assertIs(test[0], test[1])
+
+    def test_access(self):
+        from awesomeyaml.nodes.tuple import ConfigTuple
+
+        test = ConfigTuple((1, 2, 3))
+        self.assertEqual(test[0], 1)
+        self.assertEqual(test[2], 3)
+        self.assertEqual(test[-1], 3)
+        self.assertEqual(test[-3], 1)
+        self.assertEqual(test.ayns.get_child(-2), 2)
+        self.assertIs(test.ayns.get_child(3), None)
+        self.assertIs(test.ayns.get_child(-4), None)
+
+        with self.assertRaises(IndexError):
+            _ = test[3]
+
+        with self.assertRaises(IndexError):
+            _ = test[-4]
+
+        with self.assertRaises(TypeError):
+            _ = test['0']
+
+        with self.assertRaises(TypeError):
+            _ = test[0.0]
+
+    def test_str(self):
+        from awesomeyaml.nodes.tuple import ConfigTuple
+
+        test = ConfigTuple((1, 'a'))
+        self.assertEqual(str(test), 'ConfigTuple(1, a)')
+        self.assertEqual(str(test), 'ConfigTuple(1, a)')
+        self.assertEqual(str(ConfigTuple(())), 'ConfigTuple()')
+
+        test = ConfigTuple((1, [2]))
+        self.assertEqual(str(test), 'ConfigTuple(1, ConfigList[2])')
+        test[1].append(3)
+        self.assertEqual(str(test), 'ConfigTuple(1, ConfigList[2, 3])')
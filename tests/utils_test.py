@@ -0,0 +1,183 @@
+# Copyright 2022 Samsung Electronics Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import types
+import unittest
+import collections
+
+from .utils import setUpModule
+
+
+class ImportNameTest(unittest.TestCase):
+    def test_import(self):
+        from awesomeyaml.utils import import_name
+        for _ in range(2):
+            self.assertIs(import_name('os'), os)
+            self.assertIs(import_name('os.path.join'), os.path.join)
+            self.assertIs(import_name('collections.OrderedDict'), collections.OrderedDict)
+            self.assertIs(import_name('int'), int)
+            self.assertIs(import_name('len'), len)
+            self.assertIs(import_name('builtins.len'), len)
+
+        with self.assertRaises(ValueError):
+            import_name('os.')
+        with self.assertRaisesRegex(ImportError, "Cannot find an entity named: 'os.path.does_not_exist'"):
+            import_name('os.path.does_not_exist')
+        with self.assertRaises(ImportError) as ctx:
+            import_name('does_not_exist')
+        self.assertEqual(ctx.exception.args, ('does_not_exist', ))
+        self.assertEqual(ctx.exception.msg, 'does_not_exist')
+        self.assertEqual(ctx.exception.name, 'does_not_exist')
+        self.assertIn('does_not_exist', repr(ctx.exception))
+
+    def test_attr_changes(self):
+        from awesomeyaml.utils import import_name
+        module = types.ModuleType('_awesomeyaml_test_module')
+        module.foo = 1
+        sys.modules[module.__name__] = module
+        try:
+            self.assertEqual(import_name('_awesomeyaml_test_module.foo'), 1)
+            module.foo = 2
+            self.assertEqual(import_name('_awesomeyaml_test_module.foo'), 2)
+            del module.foo
+            with self.assertRaises(ImportError):
+                import_name('_awesomeyaml_test_module.foo')
+        finally:
+            del sys.modules[module.__name__]
+
+
+class WeakMemoTest(unittest.TestCase):
+    def test_access(self):
+        from awesomeyaml.utils import WeakMemo
+
+        class Obj():
+            pass
+
+        a, b, c = Obj(), [1], None
+        memo = WeakMemo()
+        memo[a] = 1
+        memo[b] = 2
+        memo[c] = 3
+        self.assertEqual(len(memo), 3)
+        self.assertEqual(memo[a], 1)
+        self.assertEqual(memo[b], 2)
+        self.assertEqual(memo[c], 3)
+        self.assertIn(a, memo)
+        self.assertNotIn(Obj(), memo)
+        self.assertNotIn([1], memo)
+        self.assertEqual({ id(k) for k in memo }, { id(a), id(b), id(c) })
+        with self.assertRaises(KeyError):
+            _ = memo[[1]]
+
+        del memo[b]
+        self.assertNotIn(b, memo)
+        self.assertEqual(memo.get(b), None)
+        with self.assertRaises(KeyError):
+            del memo[b]
+
+    def test_release(self):
+        import gc
+        from awesomeyaml.utils import WeakMemo
+
+        class Obj():
+            pass
+
+        memo = WeakMemo()
+        objs = [Obj() for _ in range(10)]
+        for idx, obj in enumerate(objs):
+            memo[obj] = idx
+
+        self.assertEqual(len(memo), 10)
+        del obj
+        objs = objs[5:]
+        gc.collect()
+        self.assertEqual(len(memo), 5)
+        self.assertEqual([memo[obj] for obj in objs], [5, 6, 7, 8, 9])
+        objs.clear()
+        gc.collect()
+        self.assertEqual(len(memo), 0)
+
+
+class LazyModuleTest(unittest.TestCase):
+    def test_module_properties(self):
+        from awesomeyaml.utils import add_module_properties, LazyModule
+        from awesomeyaml.namespace import staticproperty
+
+        module = types.ModuleType('_awesomeyaml_lazy_test_module')
+        module.foo = 1
+        sys.modules[module.__name__] = module
+        try:
+            add_module_properties(module.__name__, { 'bar': staticproperty(staticmethod(lambda: 2)) })
+            lazy = sys.modules[module.__name__]
+            self.assertIsInstance(lazy, LazyModule)
+            for _ in range(2):
+                self.assertEqual(lazy.foo, 1)
+                self.assertEqual(lazy.bar, 2)
+            self.assertEqual(lazy.__name__, module.__name__)
+            with self.assertRaises(AttributeError):
+                _ = lazy.baz
+
+            add_module_properties(module.__name__, { 'baz': staticproperty(staticmethod(lambda: 3)) })
+            self.assertIs(sys.modules[module.__name__], lazy)
+            self.assertEqual(lazy.baz, 3)
+
+            sys.modules[module.__name__] = module
+            add_module_properties(module.__name__, {})
+            self.assertIs(type(sys.modules[module.__name__]), type(lazy))
+        finally:
+            del sys.modules[module.__name__]
+
+
+class PythonVersionTest(unittest.TestCase):
+    def test_version(self):
+        from awesomeyaml.utils import python_is_at_least, python_is_exactly
+        major, minor = sys.version_info[:2]
+        self.assertTrue(python_is_at_least(major, minor))
+        self.assertTrue(python_is_at_least(major, minor - 1))
+        self.assertTrue(python_is_at_least(major - 1, minor + 1))
+        self.assertFalse(python_is_at_least(major, minor + 1))
+        self.assertFalse(python_is_at_least(major + 1, 0))
+        self.assertTrue(python_is_exactly(major, minor))
+        self.assertFalse(python_is_exactly(major, minor + 1))
+
+
+class PadWithNoneTest(unittest.TestCase):
+    def test_pad(self):
+        from awesomeyaml.utils import pad_with_none
+        self.assertEqual(pad_with_none(1, 2), (1, 2))
+        self.assertEqual(pad_with_none(1, 2, minlen=1), (1, 2))
+        self.assertEqual(pad_with_none(1, 2, minlen=2), (1, 2))
+        self.assertEqual(pad_with_none(1, minlen=3), (1, None, None))
+        self.assertEqual(pad_with_none(minlen=2), (None, None))
+
+
+class BunchTest(unittest.TestCase):
+    def test_attributes(self):
+        import pickle
+        from awesomeyaml.utils import Bunch
+        b = Bunch({ 'foo': 1 })
+        self.assertEqual(b.foo, 1)
+        b.bar = 2
+        self.assertEqual(b['bar'], 2)
+        b._private = 3
+        self.assertNotIn('_private', b)
+        self.assertEqual(b._private, 3)
+        with self.assertRaises(AttributeError):
+            _ = b.baz
+        self.assertFalse(hasattr(b, 'baz'))
+        del b.foo
+        self.assertNotIn('foo', b)
+        self.assertEqual(pickle.loads(pickle.dumps(b)), { 'bar': 2 })
@@ -0,0 +1,35 @@
+# Copyright 2022 Samsung Electronics Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from .utils import setUpModule
+
+
+class VersionTest(unittest.TestCase):
+    def test_info(self):
+        import awesomeyaml
+        from awesomeyaml import version
+        info = version.info()
+        self.assertEqual(set(info.keys()), set(version.__all__))
+        self.assertEqual(info['version'], awesomeyaml.__version__)
+        self.assertEqual(info['repo'], version.repo)
+        self.assertEqual(info['commit'], version.commit)
+        self.assertEqual(info['has_repo'], version.has_repo)
+        self.assertEqual(awesomeyaml.__commit__, version.commit)
+        self.assertIsInstance(version.has_repo, bool)
+        info['version'] = None
+        self.assertEqual(version.info()['version'], awesomeyaml.__version__)
+        with self.assertRaises(AttributeError):
+            _ = version.does_not_exist
@@ -0,0 +1,110 @@
+# Copyright 2022 Samsung Electronics Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from .utils import setUpModule
+
+
+class MetadataTest(unittest.TestCase):
+    def test_metadata_end(self):
+        from awesomeyaml.yaml import _get_metadata_end
+        for data, expected in [
+            ("!x{{ 'delete': False }} foo", "!x{{ 'delete': False }}"),
+            ("!x{{ 'a': {'b': 1}}}", "!x{{ 'a': {'b': 1}}}"),
+            ("!x{{ 'a': '}}', 'b': \"{\" }} foo", "!x{{ 'a': '}}', 'b': \"{\" }}"),
+            ("!x{{ 'a': 'it\\'s }}' }}", "!x{{ 'a': 'it\\'s }}' }}"),
+            ("!x{{ 'a': '''}}''' }}", "!x{{ 'a': '''}}''' }}"),
+            ("!x{{ 'a': 1, # }}\n 'b': '#' }} foo", "!x{{ 'a': 1, # }}\n 'b': '#' }}"),
+        ]:
+            self.assertEqual(data[:_get_metadata_end(data, 2)], expected)
+
+        self.assertIsNone(_get_metadata_end("!x{{ 'a': 1 }", 2))
+        self.assertIsNone(_get_metadata_end("!x{{ 'a }}", 2))
+        self.assertIsNone(_get_metadata_end("!x{{ 'a': 1 # }}", 2))
+
+    def test_parse_metadata(self):
+        from awesomeyaml import yaml as y
+        parsed = next(y.parse("a: !metadata{{ 'foo': {'bar': '}}'}, 'priority': 1 }} 1"))
+        self.assertEqual(parsed.a, 1)
+        self.assertEqual(parsed.a.ayns.metadata, { 'foo': { 'bar': '}}' } })
+        self.assertEqual(parsed.a.ayns.priority, 1)
+
+    def test_encoded_metadata(self):
+        import pickle
+        from awesomeyaml import yaml as y
+        metadata = { 'foo': 'bar', 'priority': 1 }
+        encoded = y._encode_metadata(metadata)
+        self.assertEqual(y._decode_metadata(encoded), { 'priority': 1, 'metadata': { 'foo': 'bar' } })
+        # older versions used hex encoding
+        legacy = pickle.dumps(metadata).hex()
+        self.assertEqual(y._decode_metadata(legacy), { 'priority': 1, 'metadata': { 'foo': 'bar' } })
+        for enc in [encoded, legacy]:
+            parsed = next(y.parse(f'a: !metadata:{enc} 1'))
+            self.assertEqual(parsed.a.ayns.metadata, { 'foo': 'bar' })
+            self.assertEqual(parsed.a.ayns.priority, 1)
+
+
+class PriorityTest(unittest.TestCase):
+    def test_invalid_priority(self):
+        from awesomeyaml import yaml as y
+        from awesomeyaml import errors
+        from awesomeyaml.nodes.node import ConfigNode
+        for priority in [2, [1]]:
+            with self.assertRaisesRegex(ValueError, 'Unknown priority value'):
+                ConfigNode({}, priority=priority)
+            with self.assertRaisesRegex(errors.ParsingError, 'Unknown priority value'):
+                next(y.parse(f"a: !metadata{{{{ 'priority': {priority} }}}} 2"))
+
+
+class ParseTest(unittest.TestCase):
+    def test_stream(self):
+        import io
+        from awesomeyaml import yaml as y
+        for src in ['a: 1\nb: [2, 3]\n', "a: !metadata{{ 'foo': 1 }} 1\nb: [2, 3]\n"]:
+            stream = io.StringIO(src)
+            parsed = next(y.parse(stream, 'foo.yaml'))
+            self.assertEqual(parsed, { 'a': 1, 'b': [2, 3] })
+            self.assertEqual(parsed.a.ayns.source_file, 'foo.yaml')
+
+    def test_stream_has_metadata(self):
+        import io
+        from awesomeyaml import yaml as y
+        old = y._scan_chunk_size
+        y._scan_chunk_size = 4
+        try:
+            # the first character is skipped to check that the original position is restored
+            for src, expected in [('x', False), ('xa: {b: 1}', False), ('x{{', True), ('xabc{{', True), ('xab{{c', True), ('xabc{ {', False)]:
+                stream = io.StringIO(src)
+                stream.seek(1)
+                self.assertEqual(y._stream_has_metadata(stream), expected)
+                self.assertEqual(stream.tell(), 1)
+        finally:
+            y._scan_chunk_size = old
+
+
+class DumpTest(unittest.TestCase):
+    def test_exclude_metadata(self):
+        from awesomeyaml import yaml as y
+        parsed = next(y.parse("a: !metadata{{ 'foo': 1, 'bar': 2 }} 1"))
+        dumped = y.dump(parsed)
+        reparsed = next(y.parse(dumped))
+        self.assertEqual(reparsed.a.ayns.metadata, { 'foo': 1, 'bar': 2 })
+
+        dumped = y.dump(parsed, exclude_metadata=['foo'])
+        reparsed = next(y.parse(dumped))
+        self.assertEqual(reparsed.a.ayns.metadata, { 'bar': 2 })
+
+        dumped = y.dump(parsed, exclude_metadata=['foo', 'bar'])
+        self.assertEqual(dumped.strip(), 'a: 1')